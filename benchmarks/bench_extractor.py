@@ -0,0 +1,102 @@
+"""
+Micro-benchmark do despacho de `PropertyExtractor`.
+
+Compara o custo por propriedade do despacho antigo (dict de métodos montado a cada
+chamada de `extract`) com a tabela pré-compilada por classe e com `extract_many`.
+
+Uso:
+----
+python benchmarks/bench_extractor.py [--pages 2000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, List
+from notion.orm.extrators.Properties import PropertyExtractor
+from notion.orm.parsers.PageProperties import PageProperties
+
+class _LegacyExtractor(PropertyExtractor):
+
+    "Reproduz o despacho anterior: o dict tipo → método é recriado a cada propriedade"
+
+    def extract(self, prop_data: dict) -> Any:
+
+        tipo = prop_data.get("type")
+        if not tipo:
+            return None
+
+        extractors = {
+            "title"        : self._title,
+            "rich_text"    : self._rich_text,
+            "number"       : self._number,
+            "checkbox"     : self._checkbox,
+            "url"          : self._url,
+            "select"       : self._select,
+            "status"       : self._status,
+            "multi_select" : self._multi_select,
+            "date"         : self._date,
+            "relation"     : self._relation,
+            "rollup"       : self._rollup,
+            "formula"      : self._formula,
+        }
+
+        extractor = extractors.get(tipo)
+        if extractor:
+            return extractor(prop_data)
+
+        return None
+
+def _page(i : int) -> Dict[str, Any]:
+
+    "Página sintética com os tipos de propriedade mais comuns"
+
+    rich_text = [{"type": "text", "text": {"content": f"nota {i}"}, "plain_text": f"nota {i}"}]
+
+    return {
+        "object"     : "page",
+        "id"         : f"page-{i}",
+        "properties" : {
+            "Name"     : {"type": "title", "title": [{"type": "text", "text": {"content": f"Linha {i}"}, "plain_text": f"Linha {i}"}]},
+            "Notes"    : {"type": "rich_text", "rich_text": rich_text},
+            "Count"    : {"type": "number", "number": i},
+            "Done"     : {"type": "checkbox", "checkbox": i % 2 == 0},
+            "Link"     : {"type": "url", "url": f"https://example.com/{i}"},
+            "Priority" : {"type": "select", "select": {"name": "alta", "color": "red"}},
+            "Stage"    : {"type": "status", "status": {"name": "feito", "color": "green"}},
+            "Tags"     : {"type": "multi_select", "multi_select": [{"name": "a", "color": "red"}, {"name": "b", "color": "blue"}]},
+            "Related"  : {"type": "relation", "relation": [{"id": f"rel-{i % 7}"}]},
+            "Total"    : {"type": "rollup", "rollup": {"type": "number", "number": i * 2}},
+            "Score"    : {"type": "formula", "formula": {"type": "number", "number": i / 3}},
+        }
+    }
+
+def _run(pages : List[Dict[str, Any]], repeat : int) -> None:
+
+    props  = [prop for page in pages for prop in page["properties"].values()]
+    legacy = _LegacyExtractor()
+    actual = PropertyExtractor()
+
+    cases = {
+        "legado (dict por chamada)" : lambda: [legacy.extract(prop) for prop in props],
+        "despacho pré-compilado"    : lambda: [actual.extract(prop) for prop in props],
+        "extract_many"              : lambda: actual.extract_many(props),
+        "PageProperties.parse_many" : lambda: PageProperties.parse_many(pages),
+    }
+
+    print(f"{len(pages)} páginas, {len(props)} propriedades, melhor de {repeat} execuções\n")
+
+    baseline = None
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number = 1, repeat = repeat))
+        per_prop = best / len(props) * 1e9
+        baseline = baseline or per_prop
+        print(f"{name:<28} {per_prop:8.1f} ns/propriedade  ({baseline / per_prop:4.2f}x)")
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--pages",  type = int, default = 2000)
+    parser.add_argument("--repeat", type = int, default = 5)
+    args = parser.parse_args()
+
+    _run([_page(i) for i in range(args.pages)], args.repeat)
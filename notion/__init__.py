@@ -1,9 +1,10 @@
-from typing import Type, TypeVar, Generic, Union, Literal
+from typing import Type, TypeVar, Generic, Union, Literal, Optional
 from .auth import headers as _headers
 from .schemas.orm.database.DatabasesContainer import DatabasesContainer as _DatabasesContainer
 from .orm.repositories import _Repositories
 from .orm.config       import ORMConfig
-from .client           import Client as _Client
+from .orm.cache.QueryCache import QueryCache
+from .client           import Client as _Client, RetryPolicy
 
 TContainer = TypeVar('TContainer', bound = _DatabasesContainer)
 
@@ -17,7 +18,17 @@ class Notion(Generic[TContainer]):
         api_token     : str,
         api_version   : Union[Literal["legacy", "data_sources"], str] = "data_sources",
         orm_container : Type[TContainer] = _DatabasesContainer,
-        timezone      : str = "Etc/UTC"
+        timezone      : str = "Etc/UTC",
+        query_cache   : Optional[QueryCache] = None,
+        trusted_responses : bool = False,
+        timeout                   : float = 30.0,
+        max_connections           : Optional[int]   = 10,
+        max_keepalive_connections : Optional[int]   = 10,
+        keepalive_expiry          : Optional[float] = 30.0,
+        rate_limit                : Optional[float] = 3.0,
+        rate_limit_burst          : int = 3,
+        max_rate_limit_retries    : int = 10,
+        retry_policy              : Optional[RetryPolicy] = None
     ): 
         
         """
@@ -25,20 +36,58 @@ class Notion(Generic[TContainer]):
             - **api_token** = Bearer Token de Integração com a API Notion.
             - **api_version** = Seleção entre versão `legacy` com Databases e versão mais nova com `data_sources`, permitindo inserir versão personalizada. Valor padrão: `legacy` *(2022-06-28)*.
             - **orm_container** = Databases Container com configuração de ORM personalizada com classe base de tipo `types.DatabasesContainer`
+            - **query_cache** = `QueryCache` opcional para reaproveitar respostas de queries repetidas (`SearchPage`). Valor padrão: `None` (desativado).
+            - **trusted_responses** = Constrói os schemas de resposta (`Page`, `Query`, `User`, `Parent`) sem revalidar os dados da API. Validators dos `NotionDatabase` continuam rodando. Pode ser sobrescrito por chamada com `trusted`. Valor padrão: `False`.
+
+            ### Transport Params
+            - **timeout** = Timeout em segundos de cada requisição.
+            - **max_connections** = Limite de conexões simultâneas no pool compartilhado.
+            - **max_keepalive_connections** = Limite de conexões ociosas mantidas abertas para reuso.
+            - **keepalive_expiry** = Tempo em segundos que uma conexão ociosa permanece aberta.
+            - **rate_limit** = Requisições por segundo permitidas pelo token bucket do client. `None` desativa o limite. Valor padrão: `3.0`.
+            - **rate_limit_burst** = Quantidade de requisições que podem sair em rajada antes do limite ser aplicado.
+            - **max_rate_limit_retries** = Quantas vezes uma requisição respondida com `429` é reenviada, respeitando `Retry-After`.
+            - **retry_policy** = `RetryPolicy` com tentativas, backoff exponencial com jitter e classificação de falhas transitórias. Valor padrão: `RetryPolicy()`.
         """
 
         headers = _headers(
             api_token   = api_token,
             api_version = api_version
         )
-        _Client.configure(headers)
+        _Client.configure(
+            headers,
+            timeout                   = timeout,
+            max_connections           = max_connections,
+            max_keepalive_connections = max_keepalive_connections,
+            keepalive_expiry          = keepalive_expiry,
+            rate_limit                = rate_limit,
+            rate_limit_burst          = rate_limit_burst,
+            max_rate_limit_retries    = max_rate_limit_retries,
+            retry_policy              = retry_policy
+        )
         self.client = _Client.get_instance()
 
-        ORMConfig.configure(timezone = timezone)
+        ORMConfig.configure(
+            timezone    = timezone,
+            query_cache = query_cache,
+            trusted_responses = trusted_responses
+        )
         self.orm = _ORM(databases_container = orm_container)
 
         self.DatabasesContainer = _DatabasesContainer
 
+    async def aclose(self) -> None:
+
+        "Fecha as conexões HTTP abertas pelo client"
+
+        await self.client.aclose()
+
+    async def __aenter__(self) -> 'Notion[TContainer]':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
 class _ORM(Generic[TContainer]):
 
     "Namespace ORM com tipo propagado"
@@ -51,4 +100,4 @@ class _ORM(Generic[TContainer]):
         self.repo = _Repositories()
         self.repo.databases.container = databases_container()
 
-__all__ = ["Notion"]
\ No newline at end of file
+__all__ = ["Notion", "RetryPolicy", "QueryCache"]
\ No newline at end of file
@@ -1,4 +1,6 @@
-from typing import Dict, Optional
+from typing import Dict, Any, Optional
+from .transport import Transport
+from .retry     import RetryPolicy
 from .blocks    import Blocks
 from .pages     import Pages
 from .databases import Databases
@@ -6,57 +8,79 @@ from .databases import Databases
 class Client:
 
     "Client singleton da API Notion"
-    
-    _headers  : Optional[Dict[str, str]] = None
-    _instance : Optional['Client']       = None
-    
+
+    _headers           : Optional[Dict[str, str]] = None
+    _transport_options : Dict[str, Any]           = {}
+    _instance          : Optional['Client']       = None
+
     def __init__(self):
+        self._transport = None
         self._blocks    = None
         self._pages     = None
         self._databases = None
-    
+
     @classmethod
-    def configure(cls, headers : Dict[str, str]):
-        
-        "Configura o client com headers"
-        
+    def configure(cls,
+        headers : Dict[str, str],
+        **transport_options : Any
+    ):
+
+        """
+        Configura o client com headers e opções do transporte HTTP.
+
+        Args:
+            headers: Headers de autenticação da API
+            transport_options: Opções repassadas ao `Transport` (timeout, limites do pool, keep-alive, rate limit e retry)
+        """
+
         cls._headers = headers
-    
+        cls._transport_options = transport_options
+
     @classmethod
     def get_instance(cls) -> 'Client':
 
         "Retorna a instância configurada"
 
         if cls._instance is None:
-            
+
             cls._instance = Client()
-        
+
         return cls._instance
-    
+
+    @property
+    def transport(self) -> Transport:
+
+        "Transporte HTTP compartilhado por todos os endpoints"
+
+        if self._transport is None:
+            self._transport = Transport(**Client._transport_options)
+
+        return self._transport
+
     @property
     def blocks(self) -> Blocks:
-        
+
         if self._blocks is None:
-        
+
             if Client._headers is None:
                 raise RuntimeError("Client não configurado. Instancie NotionIntegration primeiro.")
-        
-            self._blocks = Blocks(Client._headers)
-        
+
+            self._blocks = Blocks(Client._headers, self.transport)
+
         return self._blocks
-    
+
     @property
     def pages(self) -> Pages:
-        
+
         if self._pages is None:
-        
+
             if Client._headers is None:
                 raise RuntimeError("Client não configurado. Instancie NotionIntegration primeiro.")
-        
-            self._pages = Pages(Client._headers)
-        
+
+            self._pages = Pages(Client._headers, self.transport)
+
         return self._pages
-    
+
     @property
     def databases(self) -> Databases:
 
@@ -64,12 +88,24 @@ class Client:
 
             if Client._headers is None:
                 raise RuntimeError("Client não configurado. Instancie NotionIntegration primeiro.")
-            
-            self._databases = Databases(Client._headers)
-        
+
+            self._databases = Databases(Client._headers, self.transport)
+
         return self._databases
 
+    async def aclose(self) -> None:
+
+        "Fecha o transporte compartilhado. Os endpoints são recriados no próximo acesso."
+
+        if self._transport is not None:
+            await self._transport.aclose()
+
+        self._transport = None
+        self._blocks    = None
+        self._pages     = None
+        self._databases = None
+
 def get_client() -> Client:
     return Client.get_instance()
 
-__all__ = ["Client", "get_client"]
\ No newline at end of file
+__all__ = ["Client", "RetryPolicy", "get_client"]
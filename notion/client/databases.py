@@ -1,64 +1,58 @@
-import httpx
-from typing import Dict
+from typing import Dict, List, Optional
+from .transport import Transport
 
 class Databases:
 
-    def __init__(self, headers : Dict[str, str]):
-        self._headers = {**headers, "Notion-Version": "2022-06-28"}
+    def __init__(self, headers : Dict[str, str], transport : Transport):
+        self._headers   = {**headers, "Notion-Version": "2022-06-28"}
+        self._transport = transport
 
     async def get(self, database_id):
 
         "Buscar informações de um Banco de Dados"
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+        return await self._transport.request(
+            "GET",
+            f'https://api.notion.com/v1/databases/{database_id}',
+            headers = self._headers
+        )
 
-            response = await client.get(
-                f'https://api.notion.com/v1/databases/{database_id}',
-                headers = self._headers
-            )
+    async def query(self, database_id, json_data = {}, filter_properties : Optional[List[str]] = None):
 
-            return response.json()
+        """
+        Buscar as Páginas de um Banco de Dados
 
-    async def query(self, database_id, json_data = {}):
+        `filter_properties` limita as propriedades retornadas em cada página (ids ou nomes).
+        """
 
-        "Buscar as Páginas de um Banco de Dados"
-        
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-
-            response = await client.post(
-                f'https://api.notion.com/v1/databases/{database_id}/query',
-                headers = self._headers,
-                json    = json_data
-            )
-
-            return response.json()
+        return await self._transport.request(
+            "POST",
+            f'https://api.notion.com/v1/databases/{database_id}/query',
+            headers = self._headers,
+            json    = json_data,
+            params  = [("filter_properties", prop) for prop in filter_properties or []]
+        )
 
     async def query_propriety(self, database_id, propriety_type, json_data = {}):
 
         "Buscar as Páginas de um Banco de Dados filtrando por uma Propriedade"
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-
-            response = await client.post(
-                f'https://api.notion.com/v1/databases/{database_id}/query?filter_properties={propriety_type}',
-                headers = self._headers,
-                json    = json_data
-            )
-            
-            return response.json()
+        return await self._transport.request(
+            "POST",
+            f'https://api.notion.com/v1/databases/{database_id}/query?filter_properties={propriety_type}',
+            headers = self._headers,
+            json    = json_data
+        )
 
     async def update(self, database_id, json_data):
 
         "Atualiza as informações sobre um Banco de Dados"
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-
-            response = await client.patch(
-                f'https://api.notion.com/v1/databases/{database_id}',
-                headers = self._headers,
-                json    = json_data
-            )
-            
-            return response.json()
+        return await self._transport.request(
+            "PATCH",
+            f'https://api.notion.com/v1/databases/{database_id}',
+            headers = self._headers,
+            json    = json_data
+        )
 
-__all__ = ["Databases"]
\ No newline at end of file
+__all__ = ["Databases"]
@@ -1,41 +1,56 @@
-import httpx
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from .transport import Transport
 
 class Pages:
 
-    def __init__(self, headers : Dict[str, str]):
-        self._headers = headers
+    def __init__(self, headers : Dict[str, str], transport : Transport):
+        self._headers   = headers
+        self._transport = transport
 
     async def get(self,
-        page_id : str
+        page_id : str,
+        filter_properties : Optional[List[str]] = None
     ):
 
-        "Buscar informações de uma Página"
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+        """
+        Buscar informações de uma Página
 
-            response = await client.get(
-                f'https://api.notion.com/v1/pages/{page_id}',
-                headers = self._headers
-            )
+        `filter_properties` limita as propriedades retornadas (ids ou nomes).
+        """
 
-            return response.json()
+        return await self._transport.request(
+            "GET",
+            f'https://api.notion.com/v1/pages/{page_id}',
+            headers = self._headers,
+            params  = [("filter_properties", prop) for prop in filter_properties or []]
+        )
 
     async def get_property(self,
         page_id : str,
-        property_name : str
+        property_name : str,
+        start_cursor : Optional[str] = None,
+        page_size : Optional[int] = None
     ):
 
-        "Buscar por informações de uma Propriedade em uma Página"
+        """
+        Buscar por informações de uma Propriedade em uma Página
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+        Propriedades paginadas (title, rich_text, relation, people, rollup) retornam uma
+        lista de property items; `start_cursor` continua a partir do `next_cursor` anterior.
+        """
 
-            response = await client.get(
-                f'https://api.notion.com/v1/pages/{page_id}/properties/{property_name}',
-                headers = self._headers
-            )
+        params = []
+        if start_cursor:
+            params.append(("start_cursor", start_cursor))
+        if page_size:
+            params.append(("page_size", str(page_size)))
 
-            return response.json()
+        return await self._transport.request(
+            "GET",
+            f'https://api.notion.com/v1/pages/{page_id}/properties/{property_name}',
+            headers = self._headers,
+            params  = params
+        )
 
     async def update_properties(self,
         page_id : str,
@@ -44,15 +59,12 @@ class Pages:
 
         "Atualiza as Propriedades de uma Página"
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-
-            response =  await client.patch(
-                f'https://api.notion.com/v1/pages/{page_id}',
-                headers = self._headers,
-                json=json_data
-            )
-
-            return response.json()
+        return await self._transport.request(
+            "PATCH",
+            f'https://api.notion.com/v1/pages/{page_id}',
+            headers = self._headers,
+            json    = json_data
+        )
 
     async def create(self,
         json_data : Dict[str, Any]
@@ -60,14 +72,12 @@ class Pages:
 
         "Criar uma nova Página"
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-
-            response = await client.post(
-                f'https://api.notion.com/v1/pages',
-                headers = self._headers,
-                json    = json_data
-            )
-
-            return response.json()
+        return await self._transport.request(
+            "POST",
+            f'https://api.notion.com/v1/pages',
+            headers    = self._headers,
+            json       = json_data,
+            idempotent = False
+        )
 
-__all__ = ["Pages"]
\ No newline at end of file
+__all__ = ["Pages"]
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Optional
+
+class RateLimiter:
+
+    """
+    Token bucket assíncrono compartilhado por todas as requisições do client.
+
+    Os chamadores aguardam em fila (FIFO) por um token, de modo que rajadas grandes
+    são distribuídas na taxa máxima sustentável em vez de falharem com `429`.
+    """
+
+    def __init__(self,
+        rate  : float = 3.0,
+        burst : int   = 3
+    ) -> None:
+
+        if rate <= 0:
+            raise ValueError("rate deve ser maior que zero")
+        if burst < 1:
+            raise ValueError("burst deve ser maior ou igual a 1")
+
+        self._rate          = rate
+        self._burst         = burst
+        self._tokens        = float(burst)
+        self._updated       = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock : Optional[asyncio.Lock] = None
+
+    def _refill(self, now : float) -> None:
+        self._tokens  = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+
+        "Aguarda até que um token esteja disponível. Chamadores são atendidos por ordem de chegada."
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+
+            while True:
+
+                now = time.monotonic()
+
+                # Pausa global imposta por um `Retry-After`
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def block(self, delay : float) -> None:
+
+        "Suspende a emissão de tokens por `delay` segundos (ex: valor de `Retry-After` em um `429`)"
+
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + delay)
+        self._tokens  = 0.0
+        self._updated = max(now, self._blocked_until)
+
+__all__ = ["RateLimiter"]
@@ -0,0 +1,99 @@
+import random
+import httpx
+from typing import Optional, FrozenSet
+
+class RetryPolicy:
+
+    """
+    Política de retentativas do client para falhas transitórias.
+
+    - Falhas em que a requisição certamente não foi processada (`409 conflict_error`,
+      erros de conexão) são repetidas para qualquer método.
+    - Falhas ambíguas (`5xx`, timeouts de leitura) só são repetidas em requisições
+      idempotentes (GET, query, PATCH), a menos que `retry_non_idempotent` seja `True`.
+    """
+
+    SAFE_STATUSES       : FrozenSet[int] = frozenset({409})
+    IDEMPOTENT_STATUSES : FrozenSet[int] = frozenset({500, 502, 503, 504})
+
+    SAFE_EXCEPTIONS = (
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+        httpx.PoolTimeout
+    )
+    IDEMPOTENT_EXCEPTIONS = (
+        httpx.ReadTimeout,
+        httpx.WriteTimeout,
+        httpx.ReadError,
+        httpx.WriteError,
+        httpx.RemoteProtocolError
+    )
+
+    def __init__(self,
+        max_attempts         : int   = 5,
+        base_delay           : float = 0.5,
+        max_delay            : float = 30.0,
+        jitter               : bool  = True,
+        retry_non_idempotent : bool  = False
+    ) -> None:
+
+        """
+        Args:
+            max_attempts: Número máximo de tentativas (incluindo a primeira). `1` desativa as retentativas
+            base_delay: Espera base em segundos, dobrada a cada tentativa
+            max_delay: Teto em segundos para a espera entre tentativas
+            jitter: Sorteia a espera entre `0` e o valor exponencial (full jitter)
+            retry_non_idempotent: Repete também falhas ambíguas em requisições não idempotentes (ex: criação de páginas)
+        """
+
+        if max_attempts < 1:
+            raise ValueError("max_attempts deve ser maior ou igual a 1")
+
+        self.max_attempts         = max_attempts
+        self.base_delay           = base_delay
+        self.max_delay            = max_delay
+        self.jitter               = jitter
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def backoff(self, attempt : int) -> float:
+
+        "Tempo de espera antes da próxima tentativa, a partir da tentativa `attempt` (1, 2, ...)"
+
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def should_retry_status(self,
+        status     : int,
+        idempotent : bool,
+        attempt    : int
+    ) -> bool:
+
+        "Indica se uma resposta com `status` deve ser repetida após a tentativa `attempt`"
+
+        if attempt >= self.max_attempts:
+            return False
+        if status in self.SAFE_STATUSES:
+            return True
+        if status in self.IDEMPOTENT_STATUSES:
+            return idempotent or self.retry_non_idempotent
+        return False
+
+    def should_retry_exception(self,
+        exc        : Exception,
+        idempotent : bool,
+        attempt    : int
+    ) -> bool:
+
+        "Indica se uma exceção de transporte deve ser repetida após a tentativa `attempt`"
+
+        if attempt >= self.max_attempts:
+            return False
+        if isinstance(exc, self.SAFE_EXCEPTIONS):
+            return True
+        if isinstance(exc, self.IDEMPOTENT_EXCEPTIONS):
+            return idempotent or self.retry_non_idempotent
+        return False
+
+__all__ = ["RetryPolicy"]
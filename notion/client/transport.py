@@ -0,0 +1,163 @@
+import asyncio
+import httpx
+from email.utils import parsedate_to_datetime
+from datetime    import datetime, timezone
+from typing      import Dict, Any, Optional
+from .ratelimit  import RateLimiter
+from .retry      import RetryPolicy
+
+class Transport:
+
+    "Transporte HTTP assíncrono compartilhado entre os endpoints, com pool de conexões e keep-alive"
+
+    def __init__(self,
+        timeout                   : float = 30.0,
+        max_connections           : Optional[int]   = 10,
+        max_keepalive_connections : Optional[int]   = 10,
+        keepalive_expiry          : Optional[float] = 30.0,
+        rate_limit                : Optional[float] = 3.0,
+        rate_limit_burst          : int = 3,
+        max_rate_limit_retries    : int = 10,
+        retry_policy              : Optional[RetryPolicy] = None
+    ) -> None:
+        self._timeout = httpx.Timeout(timeout)
+        self._limits  = httpx.Limits(
+            max_connections           = max_connections,
+            max_keepalive_connections = max_keepalive_connections,
+            keepalive_expiry          = keepalive_expiry
+        )
+        self._client : Optional[httpx.AsyncClient] = None
+        self._limiter : Optional[RateLimiter] = None
+        if rate_limit:
+            self._limiter = RateLimiter(
+                rate  = rate_limit,
+                burst = rate_limit_burst
+            )
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._retry = retry_policy if retry_policy is not None else RetryPolicy()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+
+        "Retorna o `httpx.AsyncClient` compartilhado, criando-o no primeiro uso"
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout = self._timeout,
+                limits  = self._limits
+            )
+
+        return self._client
+
+    async def request(self,
+        method  : str,
+        url     : str,
+        headers : Dict[str, str],
+        json    : Optional[Dict[str, Any]] = None,
+        params  : Optional[Any] = None,
+        idempotent : bool = True
+    ) -> Dict[str, Any]:
+
+        """
+        Executa uma requisição reaproveitando as conexões abertas do pool.
+
+        Toda requisição passa pelo rate limiter. Respostas `429` suspendem o limiter
+        pelo tempo indicado em `Retry-After` e a requisição é reenviada. Demais falhas
+        transitórias seguem a `RetryPolicy` configurada, considerando `idempotent`.
+        """
+
+        rate_limited = 0
+        attempt      = 0
+
+        while True:
+
+            if self._limiter is not None:
+                await self._limiter.acquire()
+
+            attempt += 1
+
+            try:
+                response = await self.client.request(
+                    method,
+                    url,
+                    headers = headers,
+                    json    = json,
+                    params  = params
+                )
+            except httpx.TransportError as exc:
+                if not self._retry.should_retry_exception(exc, idempotent, attempt):
+                    raise
+                await asyncio.sleep(self._retry.backoff(attempt))
+                continue
+
+            if response.status_code == 429 and rate_limited < self._max_rate_limit_retries:
+
+                # 429 não conta como tentativa: a requisição não foi processada
+                rate_limited += 1
+                attempt      -= 1
+                delay = self._retry_after(response)
+
+                if self._limiter is not None:
+                    self._limiter.block(delay)
+                else:
+                    await asyncio.sleep(delay)
+
+                continue
+
+            if self._retry.should_retry_status(response.status_code, idempotent, attempt):
+                delay = self._retry.backoff(attempt)
+                if "Retry-After" in response.headers:
+                    delay = max(delay, self._retry_after(response))
+                await asyncio.sleep(delay)
+                continue
+
+            return self._decode(response)
+
+    @staticmethod
+    def _decode(response : httpx.Response) -> Dict[str, Any]:
+
+        "Decodifica o JSON da resposta, convertendo corpos inválidos (ex: páginas HTML de gateway) em um erro no formato da API"
+
+        try:
+            return response.json()
+        except ValueError:
+            return {
+                "object"  : "error",
+                "status"  : response.status_code,
+                "code"    : "invalid_response",
+                "message" : response.text[:500]
+            }
+
+    @staticmethod
+    def _retry_after(response : httpx.Response, default : float = 1.0) -> float:
+
+        "Lê o header `Retry-After` (segundos ou HTTP-date) de uma resposta"
+
+        value = response.headers.get("Retry-After")
+        if not value:
+            return default
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return default
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo = timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    async def aclose(self) -> None:
+
+        "Fecha as conexões abertas do pool"
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+__all__ = ["Transport"]
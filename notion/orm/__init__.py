@@ -3,6 +3,9 @@ from .common       import Common    as _common
 from .parsers      import Parser    as _parser
 from .mapping      import Mapping   as _mapping
 from .repositories import repo      as _repositories
+from .sync         import Sync      as _sync
+from .cache        import Cache     as _cache
+from .export       import Export    as _export
 
 class _NotionOrm:
 
@@ -12,6 +15,9 @@ class _NotionOrm:
         self.parser  = _parser
         self.mapping = _mapping
         self.repo    = _repositories
+        self.sync    = _sync
+        self.cache   = _cache
+        self.export  = _export
 
 NotionOrm = _NotionOrm()
 __all__ = ["NotionOrm"]
\ No newline at end of file
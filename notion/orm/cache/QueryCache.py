@@ -0,0 +1,120 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Set, Tuple
+
+class QueryCache:
+
+    """
+    Cache de respostas de query com expiração (TTL) e descarte LRU.
+
+    As respostas são indexadas por um hash canônico de database + corpo da query
+    (filtro, ordenação, `page_size` e cursor) e invalidadas automaticamente quando
+    o SDK escreve na database.
+    """
+
+    def __init__(self,
+        ttl         : float = 60.0,
+        max_entries : int   = 256
+    ) -> None:
+
+        """
+        Args:
+            ttl: Tempo em segundos que uma resposta permanece válida
+            max_entries: Quantidade máxima de respostas mantidas; as menos usadas são descartadas primeiro
+        """
+
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser maior ou igual a 1")
+
+        self.ttl         = ttl
+        self.max_entries = max_entries
+        self._entries  : 'OrderedDict[str, Tuple[float, str, str]]' = OrderedDict()
+        self._by_database : Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def _database_key(database_id : str) -> str:
+        return database_id.replace("-", "").lower()
+
+    @staticmethod
+    def key(
+        database_id : str,
+        payload     : Dict[str, Any],
+        params      : Optional[Any] = None
+    ) -> str:
+
+        "Hash canônico da query"
+
+        canonical = json.dumps(
+            {
+                "database_id" : QueryCache._database_key(database_id),
+                "payload"     : payload,
+                "params"      : params
+            },
+            sort_keys  = True,
+            separators = (",", ":"),
+            default    = str
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key : str) -> Optional[Dict[str, Any]]:
+
+        "Retorna uma cópia da resposta em cache ou `None` se ausente/expirada"
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, database_key, body = entry
+        if expires_at < time.monotonic():
+            self._discard(key, database_key)
+            return None
+
+        self._entries.move_to_end(key)
+        return json.loads(body)
+
+    def set(self,
+        database_id : str,
+        key         : str,
+        response    : Dict[str, Any]
+    ) -> None:
+
+        "Armazena uma cópia serializada da resposta"
+
+        database_key = self._database_key(database_id)
+
+        self._entries[key] = (time.monotonic() + self.ttl, database_key, json.dumps(response))
+        self._entries.move_to_end(key)
+        self._by_database.setdefault(database_key, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest, (_, oldest_database, _) = next(iter(self._entries.items()))
+            self._discard(oldest, oldest_database)
+
+    def invalidate(self, database_id : str) -> None:
+
+        "Descarta todas as respostas em cache de uma database"
+
+        for key in self._by_database.pop(self._database_key(database_id), set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+
+        "Descarta todo o cache"
+
+        self._entries.clear()
+        self._by_database.clear()
+
+    def _discard(self, key : str, database_key : str) -> None:
+        self._entries.pop(key, None)
+        keys = self._by_database.get(database_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_database[database_key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+__all__ = ["QueryCache"]
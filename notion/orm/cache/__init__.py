@@ -0,0 +1,9 @@
+from .QueryCache import QueryCache as _QueryCache
+
+class _Cache:
+
+    def __init__(self) -> None:
+        self.QueryCache = _QueryCache
+
+Cache = _Cache()
+__all__ = ["Cache"]
@@ -0,0 +1,294 @@
+from typing   import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from datetime import datetime, date, timezone
+from .QueryFilter import _NotionFilter, _PropertyFilter, _TimestampFilter, _GroupFilter, _AndFilter
+
+class FilterEvaluator:
+
+    """
+    Avalia árvores de `QueryFilter` em memória contra páginas já buscadas.
+
+    Aceita páginas cruas da API, `Page` com propriedades genéricas (chaves = nomes no Notion)
+    ou dicts já parseados por `PageProperties.parse`. Comparações de texto ignoram maiúsculas.
+    """
+
+    # Apenas tipos com extrator no `PropertyExtractor`; os demais (email, phone_number, people,
+    # created_by, last_edited_by) chegariam sempre como `None` e são recusados
+    _TEXT_TYPES = frozenset({"title", "rich_text", "url"})
+
+    @classmethod
+    def matches(cls,
+        filter_obj : _NotionFilter,
+        record     : Any
+    ) -> bool:
+
+        "Indica se a página atende ao filtro"
+
+        properties, timestamps = cls._prepare(record)
+        return cls._evaluate(filter_obj, properties, timestamps)
+
+    @classmethod
+    def apply(cls,
+        filter_obj : _NotionFilter,
+        records    : Iterable[Any]
+    ) -> Iterator[Any]:
+
+        "Retorna apenas as páginas que atendem ao filtro, na ordem original"
+
+        for record in records:
+            if cls.matches(filter_obj, record):
+                yield record
+
+    # ==================== PREPARAÇÃO ====================
+
+    @staticmethod
+    def _prepare(record : Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+
+        "Separa as propriedades parseadas e os timestamps da página"
+
+        from ..parsers.PageProperties import PageProperties as _PageProperties
+
+        if not isinstance(record, dict) and hasattr(record, "properties"):
+            timestamps = {
+                "created_time"     : getattr(record, "created_time", None),
+                "last_edited_time" : getattr(record, "last_edited_time", None)
+            }
+            properties = record.properties
+            if not isinstance(properties, dict):
+                raise TypeError("Avaliação local exige propriedades genéricas (chaves = nomes no Notion)")
+            return properties, timestamps
+
+        if isinstance(record, dict) and "properties" in record:
+            properties = record.get("properties") or {}
+            if any(isinstance(value, dict) and "type" in value for value in properties.values()):
+                properties = _PageProperties.parse(record) or {}
+            return properties, record
+
+        return record or {}, {}
+
+    # ==================== AVALIAÇÃO ====================
+
+    @classmethod
+    def _evaluate(cls,
+        filter_obj : _NotionFilter,
+        properties : Dict[str, Any],
+        timestamps : Dict[str, Any]
+    ) -> bool:
+
+        if isinstance(filter_obj, _GroupFilter):
+            results = (cls._evaluate(child, properties, timestamps) for child in filter_obj.filters)
+            return all(results) if isinstance(filter_obj, _AndFilter) else any(results)
+
+        if isinstance(filter_obj, _TimestampFilter):
+            return cls._date(filter_obj.condition, filter_obj.value, timestamps.get(filter_obj.timestamp))
+
+        if isinstance(filter_obj, _PropertyFilter):
+            return cls._property(filter_obj, properties, timestamps)
+
+        raise TypeError(f"Filtro '{type(filter_obj).__name__}' não suportado na avaliação local")
+
+    @classmethod
+    def _property(cls,
+        filter_obj : _PropertyFilter,
+        properties : Dict[str, Any],
+        timestamps : Dict[str, Any]
+    ) -> bool:
+
+        kind      = filter_obj.property_type
+        condition = filter_obj.condition
+        expected  = filter_obj.value
+
+        if kind in ("created_time", "last_edited_time"):
+            value = properties.get(filter_obj.property_name, timestamps.get(kind))
+            return cls._date(condition, expected, value)
+
+        value = properties.get(filter_obj.property_name)
+
+        if kind.startswith("formula."):
+            kind = {
+                "formula.string"   : "rich_text",
+                "formula.number"   : "number",
+                "formula.checkbox" : "checkbox",
+                "formula.date"     : "date"
+            }.get(kind, kind)
+
+        if kind in cls._TEXT_TYPES:
+            if isinstance(value, dict):
+                value = value.get("text")
+            return cls._text(condition, expected, value)
+        if kind == "number":
+            return cls._number(condition, expected, value)
+        if kind == "checkbox":
+            return cls._checkbox(condition, expected, value)
+        if kind in ("select", "status"):
+            return cls._select(condition, expected, value)
+        if kind == "multi_select":
+            names = [item.get("name") for item in value] if value else []
+            return cls._contains(condition, expected, names)
+        if kind == "date":
+            return cls._date(condition, expected, value)
+        if kind == "relation":
+            ids = [cls._id(item) for item in value] if value else []
+            return cls._contains(condition, cls._id(expected) if isinstance(expected, str) else expected, ids)
+
+        raise ValueError(f"Filtro do tipo '{filter_obj.property_type}' não suportado na avaliação local")
+
+    # ==================== CONDIÇÕES ====================
+
+    @staticmethod
+    def _empty(condition : str, value : Any) -> Optional[bool]:
+        "Resolve `is_empty`/`is_not_empty`; retorna `None` para as demais condições"
+        empty = value is None or value == "" or value == []
+        if condition == "is_empty":
+            return empty
+        if condition == "is_not_empty":
+            return not empty
+        return None
+
+    @classmethod
+    def _text(cls, condition : str, expected : Any, value : Optional[str]) -> bool:
+
+        resolved = cls._empty(condition, value)
+        if resolved is not None:
+            return resolved
+
+        text   = (value or "").casefold()
+        target = str(expected).casefold()
+
+        if condition == "equals":
+            return text == target
+        if condition == "does_not_equal":
+            return text != target
+        if condition == "contains":
+            return target in text
+        if condition == "does_not_contain":
+            return target not in text
+        if condition == "starts_with":
+            return text.startswith(target)
+        if condition == "ends_with":
+            return text.endswith(target)
+
+        raise ValueError(f"Condição '{condition}' não suportada para texto")
+
+    @classmethod
+    def _number(cls, condition : str, expected : Any, value : Optional[float]) -> bool:
+
+        resolved = cls._empty(condition, value)
+        if resolved is not None:
+            return resolved
+
+        if condition == "does_not_equal":
+            return value != expected
+        if value is None:
+            return False
+        if condition == "equals":
+            return value == expected
+        if condition == "greater_than":
+            return value > expected
+        if condition == "less_than":
+            return value < expected
+        if condition == "greater_than_or_equal_to":
+            return value >= expected
+        if condition == "less_than_or_equal_to":
+            return value <= expected
+
+        raise ValueError(f"Condição '{condition}' não suportada para number")
+
+    @staticmethod
+    def _checkbox(condition : str, expected : Any, value : Optional[bool]) -> bool:
+
+        if condition == "equals":
+            return bool(value) == bool(expected)
+        if condition == "does_not_equal":
+            return bool(value) != bool(expected)
+
+        raise ValueError(f"Condição '{condition}' não suportada para checkbox")
+
+    @classmethod
+    def _select(cls, condition : str, expected : Any, value : Optional[Dict[str, Any]]) -> bool:
+
+        name = value.get("name") if isinstance(value, dict) else value
+
+        resolved = cls._empty(condition, name)
+        if resolved is not None:
+            return resolved
+
+        if condition == "equals":
+            return name == expected
+        if condition == "does_not_equal":
+            return name != expected
+
+        raise ValueError(f"Condição '{condition}' não suportada para select/status")
+
+    @classmethod
+    def _contains(cls, condition : str, expected : Any, values : list) -> bool:
+
+        resolved = cls._empty(condition, values)
+        if resolved is not None:
+            return resolved
+
+        if condition in ("contains", "equals"):
+            return expected in values
+        if condition in ("does_not_contain", "does_not_equal"):
+            return expected not in values
+
+        raise ValueError(f"Condição '{condition}' não suportada para listas")
+
+    @staticmethod
+    def _id(value : Any) -> Any:
+        "Normaliza ids do Notion (com ou sem hífens)"
+        if isinstance(value, dict):
+            value = value.get("id")
+        return value.replace("-", "") if isinstance(value, str) else value
+
+    @staticmethod
+    def _to_datetime(value : Any) -> Optional[Union[datetime, date]]:
+        if value is None or isinstance(value, (datetime, date)):
+            return value
+        if isinstance(value, str):
+            text = value[:-1] + "+00:00" if value.endswith("Z") else value
+            if len(text) == 10:
+                return date.fromisoformat(text)
+            return datetime.fromisoformat(text)
+        return None
+
+    @classmethod
+    def _date(cls, condition : str, expected : Any, value : Any) -> bool:
+
+        if isinstance(value, dict):
+            value = value.get("start")
+
+        resolved = cls._empty(condition, value)
+        if resolved is not None:
+            return resolved
+
+        if value is None:
+            return condition == "does_not_equal"
+
+        actual = cls._to_datetime(value)
+        target = cls._to_datetime(expected)
+
+        # Filtros só com data comparam apenas o dia
+        if not isinstance(target, datetime) or not isinstance(actual, datetime):
+            actual = actual.date() if isinstance(actual, datetime) else actual
+            target = target.date() if isinstance(target, datetime) else target
+        elif (actual.tzinfo is None) != (target.tzinfo is None):
+            # Horários sem fuso são tratados como UTC
+            actual = actual.astimezone(timezone.utc).replace(tzinfo = None) if actual.tzinfo else actual
+            target = target.astimezone(timezone.utc).replace(tzinfo = None) if target.tzinfo else target
+
+        if condition == "equals":
+            return actual == target
+        if condition == "does_not_equal":
+            return actual != target
+        if condition == "before":
+            return actual < target
+        if condition == "after":
+            return actual > target
+        if condition == "on_or_before":
+            return actual <= target
+        if condition == "on_or_after":
+            return actual >= target
+
+        raise ValueError(f"Condição '{condition}' não suportada para datas")
+
+__all__ = ["FilterEvaluator"]
@@ -1,14 +1,56 @@
-from typing   import Any, Dict, Literal, Union
+import hashlib
+import json
+from typing   import Any, Dict, Iterable, Iterator, Literal, Optional, Tuple, Union
 from datetime import datetime, date
 
 class _NotionFilter:
     
-    "Classe base para filtros do Notion"
+    """
+    Classe base para filtros do Notion.
+
+    Filtros são imutáveis depois de construídos: `to_dict`, `normalize` e
+    `fingerprint` são calculados uma única vez por nó e reaproveitados.
+    """
+
+    _dict        : Optional[Dict[str, Any]] = None
+    _canonical   : Optional[str]            = None
+    _fingerprint : Optional[str]            = None
     
     def to_dict(self) -> Dict[str, Any]:
-        "Converte o filtro para o formato JSON do Notion"
+        "Converte o filtro para o formato JSON do Notion. O dict retornado é compartilhado e não deve ser alterado"
+        if self._dict is None:
+            self._dict = self._to_dict()
+        return self._dict
+
+    def _to_dict(self) -> Dict[str, Any]:
         raise NotImplementedError
+
+    def canonical(self) -> str:
+        "Serialização JSON determinística deste nó (chaves ordenadas)"
+        if self._canonical is None:
+            self._canonical = json.dumps(self.to_dict(), sort_keys = True, separators = (",", ":"), default = str)
+        return self._canonical
+
+    def normalize(self) -> '_NotionFilter':
+        "Retorna a forma canônica do filtro: grupos aninhados do mesmo operador achatados, folhas duplicadas removidas e filhos ordenados"
+        return self
+
+    def fingerprint(self) -> str:
+        "Hash estável da forma canônica. Filtros logicamente idênticos têm o mesmo fingerprint"
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(self.normalize().canonical().encode()).hexdigest()
+        return self._fingerprint
     
+    def matches(self, page: Any) -> bool:
+        "Avalia o filtro em memória contra uma página já buscada (crua, `Page` genérica ou propriedades parseadas)"
+        from .FilterEvaluator import FilterEvaluator
+        return FilterEvaluator.matches(self, page)
+
+    def apply(self, pages: Iterable[Any]) -> Iterator[Any]:
+        "Filtra em memória uma coleção de páginas já buscadas, sem nova requisição"
+        from .FilterEvaluator import FilterEvaluator
+        return FilterEvaluator.apply(self, pages)
+
     def and_(self, *filters: '_NotionFilter') -> '_NotionFilter':
         "Combina este filtro com outros usando AND"
         return _AndFilter(self, *filters)
@@ -32,7 +74,7 @@ class _PropertyFilter(_NotionFilter):
         self.condition = condition
         self.value = value
     
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict(self) -> Dict[str, Any]:
         return {
             "property": self.property_name,
             self.property_type: {
@@ -40,30 +82,70 @@ class _PropertyFilter(_NotionFilter):
             }
         }
 
-class _AndFilter(_NotionFilter):
+class _TimestampFilter(_NotionFilter):
 
-    "Combina múltiplos filtros com AND"
-    
-    def __init__(self, *filters: _NotionFilter):
-        self.filters = list(filters)
-    
-    def to_dict(self) -> Dict[str, Any]:
+    "Filtro pelos timestamps da página (`created_time`/`last_edited_time`), sem depender de uma propriedade na database"
+
+    def __init__(self,
+        timestamp: str,
+        condition: str,
+        value: Any
+    ):
+        self.timestamp = timestamp
+        self.condition = condition
+        self.value = value
+
+    def _to_dict(self) -> Dict[str, Any]:
         return {
-            "and": [filter_obj.to_dict() for filter_obj in self.filters]
+            "timestamp": self.timestamp,
+            self.timestamp: {
+                self.condition: self.value
+            }
         }
 
-class _OrFilter(_NotionFilter):
+class _GroupFilter(_NotionFilter):
+
+    "Base para grupos comutativos de filtros (AND/OR)"
+
+    operator : str
+    _normalized : Optional['_NotionFilter'] = None
 
-    "Combina múltiplos filtros com OR"
-    
     def __init__(self, *filters: _NotionFilter):
-        self.filters = list(filters)
-    
-    def to_dict(self) -> Dict[str, Any]:
+        self.filters : Tuple[_NotionFilter, ...] = tuple(filters)
+
+    def _to_dict(self) -> Dict[str, Any]:
         return {
-            "or": [filter_obj.to_dict() for filter_obj in self.filters]
+            self.operator: [filter_obj.to_dict() for filter_obj in self.filters]
         }
 
+    def normalize(self) -> _NotionFilter:
+        if self._normalized is None:
+            children : Dict[str, _NotionFilter] = {}
+            for filter_obj in self.filters:
+                filter_obj = filter_obj.normalize()
+                # and_(a, and_(b, c)) -> and_(a, b, c)
+                group = filter_obj.filters if type(filter_obj) is type(self) else (filter_obj,)
+                for child in group:
+                    children.setdefault(child.canonical(), child)
+            ordered = [children[key] for key in sorted(children)]
+            normalized = ordered[0] if len(ordered) == 1 else type(self)(*ordered)
+            if isinstance(normalized, _GroupFilter):
+                normalized._normalized = normalized
+            self._normalized = normalized
+        return self._normalized
+
+class _AndFilter(_GroupFilter):
+
+    "Combina múltiplos filtros com AND"
+
+    operator = "and"
+
+class _OrFilter(_GroupFilter):
+
+    "Combina múltiplos filtros com OR"
+
+    operator = "or"
+
 class QueryFilter:
 
     "Builder principal para criar filtros"
@@ -78,6 +160,36 @@ class QueryFilter:
         "Combina filtros com OR"
         return _OrFilter(*filters)
 
+    @staticmethod
+    def timestamp(
+        timestamp: Literal["created_time", "last_edited_time"],
+        condition: Literal[
+            "equals",
+            "before",
+            "after",
+            "on_or_before",
+            "on_or_after",
+            "past_week",
+            "past_month",
+            "past_year",
+            "next_week",
+            "next_month",
+            "next_year"
+        ],
+        value: Union[datetime, date, Dict[str, Any]]
+    ) -> _TimestampFilter:
+        if isinstance(value, datetime):
+            property_value = value.isoformat()
+        elif isinstance(value, date):
+            property_value = value.strftime("%Y-%m-%d")
+        else:
+            property_value = value
+        return _TimestampFilter(
+            timestamp = timestamp,
+            condition = condition,
+            value     = property_value
+        )
+
     @staticmethod
     def created_time(
         property_name: str,
@@ -0,0 +1,106 @@
+from typing   import List, Literal, Optional, Sequence, Union
+from datetime import datetime, date, timedelta
+from .QueryFilter import QueryFilter, _NotionFilter, _PropertyFilter
+
+class QueryPartition:
+
+    """
+    Builders de partições disjuntas para leituras paralelas de uma database.
+    Cada partição é um filtro; juntas, elas cobrem todas as páginas da database.
+    """
+
+    @staticmethod
+    def created_time(
+        start         : Union[date, datetime],
+        end           : Union[date, datetime],
+        shards        : int,
+        property_name : Optional[str] = None
+    ) -> List[_NotionFilter]:
+
+        """
+        Divide a database em `shards` faixas de `created_time` entre `start` e `end`.
+
+        A primeira faixa inclui tudo antes de `start` e a última tudo a partir do seu
+        limite inferior, então nenhuma página fica de fora. Sem `property_name`, usa o
+        timestamp da página (`{"timestamp": "created_time"}`).
+        """
+
+        if shards < 1:
+            raise ValueError("shards deve ser maior ou igual a 1")
+
+        if isinstance(start, datetime) != isinstance(end, datetime):
+            # Data sem horário misturada com datetime: vira meia-noite no fuso do outro limite
+            tzinfo = (start if isinstance(start, datetime) else end).tzinfo
+            if not isinstance(start, datetime):
+                start = datetime(start.year, start.month, start.day, tzinfo = tzinfo)
+            else:
+                end = datetime(end.year, end.month, end.day, tzinfo = tzinfo)
+        elif isinstance(start, datetime) and (start.tzinfo is None) != (end.tzinfo is None):
+            raise ValueError("start e end devem ser ambos com ou ambos sem fuso horário")
+
+        if end <= start:
+            raise ValueError("end deve ser maior que start")
+
+        if not isinstance(start, datetime) and not isinstance(end, datetime):
+            # Datas sem horário: os limites são arredondados para dias inteiros
+            days   = max(1, (end - start).days)
+            shards = min(shards, days)
+            bounds = [start + timedelta(days = days * i // shards) for i in range(shards + 1)]
+        else:
+            step   = (end - start) / shards
+            bounds = [start + step * i for i in range(shards + 1)]
+
+        def condition(name, value):
+            if property_name is None:
+                return QueryFilter.timestamp("created_time", name, value)
+            if isinstance(value, datetime):
+                # `QueryFilter.created_time` formata só a data; os limites precisam do horário
+                return _PropertyFilter(property_name, "created_time", name, value.isoformat())
+            return QueryFilter.created_time(property_name, name, value)
+
+        if shards == 1:
+            return [QueryFilter.or_(
+                condition("before", bounds[1]),
+                condition("on_or_after", bounds[1])
+            )]
+
+        partitions : List[_NotionFilter] = [condition("before", bounds[1])]
+        for lower, upper in zip(bounds[1:-2], bounds[2:-1]):
+            partitions.append(
+                QueryFilter.and_(
+                    condition("on_or_after", lower),
+                    condition("before", upper)
+                )
+            )
+        partitions.append(condition("on_or_after", bounds[-2]))
+
+        return partitions
+
+    @staticmethod
+    def values(
+        property_type : Literal["select", "status"],
+        property_name : str,
+        values        : Sequence[str]
+    ) -> List[_NotionFilter]:
+
+        """
+        Uma partição por valor de uma propriedade `select`/`status`, mais partições
+        para valores não listados e para páginas sem valor.
+        """
+
+        builder = QueryFilter.select if property_type == "select" else QueryFilter.status
+
+        partitions : List[_NotionFilter] = [
+            builder(property_name, "equals", value) for value in values
+        ]
+        if values:
+            partitions.append(
+                QueryFilter.and_(*[
+                    builder(property_name, "does_not_equal", value) for value in values
+                ])
+            )
+        partitions.append(builder(property_name, "is_empty", True))
+
+        return partitions
+
+__all__ = ["QueryPartition"]
@@ -1,13 +1,17 @@
-from .QueryFilter import QueryFilter as _QueryFilter
-from .QuerySort   import QuerySort   as _QuerySort
-from .SetProperty import SetProperty as _SetProperty
+from .QueryFilter    import QueryFilter    as _QueryFilter
+from .QuerySort      import QuerySort      as _QuerySort
+from .QueryPartition import QueryPartition as _QueryPartition
+from .SetProperty    import SetProperty    as _SetProperty
+from .FilterEvaluator import FilterEvaluator as _FilterEvaluator
 
 class _Common:
 
     def __init__(self) -> None:
-        self.QueryFilter = _QueryFilter
-        self.QuerySort   = _QuerySort
-        self.SetProperty = _SetProperty
+        self.QueryFilter    = _QueryFilter
+        self.QuerySort      = _QuerySort
+        self.QueryPartition = _QueryPartition
+        self.SetProperty    = _SetProperty
+        self.FilterEvaluator = _FilterEvaluator
 
 Common = _Common()
-__all__ = ["Common"]
\ No newline at end of file
+__all__ = ["Common"]
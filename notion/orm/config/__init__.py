@@ -1,20 +1,29 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..cache.QueryCache import QueryCache
 
 class ORMConfig:
 
     "Configuração global do ORM"
     
     _timezone: str = "Etc/UTC"
+    _query_cache: Optional['QueryCache'] = None
+    _trusted_responses: bool = False
     _configured: bool = False
     
     @classmethod
     def configure(cls,
-        timezone : str = "Etc/UTC"
+        timezone    : str = "Etc/UTC",
+        query_cache : Optional['QueryCache'] = None,
+        trusted_responses : bool = False
     ):
 
         "Configura o ORM"
 
         cls._timezone = timezone
+        cls._query_cache = query_cache
+        cls._trusted_responses = trusted_responses
         cls._configured = True
     
     @classmethod
@@ -24,4 +33,20 @@ class ORMConfig:
         
         return cls._timezone
 
-__all__ = ["ORMConfig"]
\ No newline at end of file
+    @classmethod
+    def get_query_cache(cls) -> Optional['QueryCache']:
+
+        "Retorna o cache de queries configurado ou `None` se desativado"
+
+        return cls._query_cache
+
+    @classmethod
+    def is_trusted(cls,
+        trusted : Optional[bool] = None
+    ) -> bool:
+
+        "Resolve o modo trusted: o valor da chamada, se informado, ou o configurado globalmente"
+
+        return cls._trusted_responses if trusted is None else trusted
+
+__all__ = ["ORMConfig"]
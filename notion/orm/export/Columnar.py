@@ -0,0 +1,319 @@
+import types
+import typing
+from array    import array
+from datetime import datetime, date, timezone
+from decimal  import Decimal
+from typing   import Optional, Dict, Any, List, Type, Callable, Iterable
+from ..mapping.database    import NotionDatabase as _NotionDatabase
+from ..extrators.Properties import _parse_datetime
+
+_EPOCH = datetime(1970, 1, 1, tzinfo = timezone.utc)
+
+def _epoch_us(value : Any) -> Optional[int]:
+
+    "Converte `datetime`/`date` em microssegundos desde a epoch (UTC). Horários sem fuso são tratados como UTC"
+
+    if isinstance(value, dict):
+        value = value.get("start")
+    if isinstance(value, str):
+        value = _parse_datetime(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo = timezone.utc)
+    elif isinstance(value, date):
+        value = datetime(value.year, value.month, value.day, tzinfo = timezone.utc)
+    else:
+        return None
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+def _to_int(value : Any) -> Optional[int]:
+
+    "Converte em `int` sem truncar: números com parte fracionária (ou não finitos) viram `None`"
+
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, Decimal):
+        return int(value) if value.is_finite() and value == value.to_integral_value() else None
+    return int(value)
+
+class Column:
+
+    "Buffer de uma coluna. Valores nulos são marcados na máscara de validade"
+
+    kind : str = "object"
+
+    def __init__(self) -> None:
+        self.valid = bytearray()
+
+    def append(self, value : Any) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def to_list(self) -> List[Any]:
+        raise NotImplementedError
+
+    def to_numpy(self, np : Any) -> Any:
+        raise NotImplementedError
+
+class _TypedColumn(Column):
+
+    "Coluna numérica em `array` tipado (`d` float, `q` int, `b` bool). Valores que a conversão rejeita (`None`) ficam inválidos"
+
+    def __init__(self, typecode : str, kind : str, convert : Callable[[Any], Any]) -> None:
+        super().__init__()
+        self.kind     = kind
+        self.values   = array(typecode)
+        self._convert = convert
+
+    def append(self, value : Any) -> None:
+        if value is not None:
+            value = self._convert(value)
+        if value is None:
+            self.values.append(0)
+            self.valid.append(0)
+            return
+        self.values.append(value)
+        self.valid.append(1)
+
+    def to_list(self) -> List[Any]:
+        if self.kind == "bool":
+            return [bool(value) if ok else None for value, ok in zip(self.values, self.valid)]
+        return [value if ok else None for value, ok in zip(self.values, self.valid)]
+
+    def to_numpy(self, np : Any) -> Any:
+        dtype  = {"float": np.float64, "int": np.int64, "bool": np.bool_}[self.kind]
+        values = np.frombuffer(self.values, dtype = {"float": np.float64, "int": np.int64, "bool": np.int8}[self.kind]).astype(dtype)
+        mask   = np.frombuffer(bytes(self.valid), dtype = np.uint8) == 0
+        if self.kind == "float":
+            values[mask] = np.nan
+            return values
+        return np.ma.MaskedArray(values, mask = mask) if mask.any() else values
+
+class _DatetimeColumn(Column):
+
+    "Coluna de datas em microssegundos desde a epoch (UTC), equivalente a `datetime64[us]`"
+
+    kind = "datetime"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = array("q")
+
+    def append(self, value : Any) -> None:
+        micros = _epoch_us(value)
+        self.values.append(micros if micros is not None else 0)
+        self.valid.append(0 if micros is None else 1)
+
+    def to_list(self) -> List[Any]:
+        return [
+            datetime.fromtimestamp(value / 1_000_000, tz = timezone.utc) if ok else None
+            for value, ok in zip(self.values, self.valid)
+        ]
+
+    def to_numpy(self, np : Any) -> Any:
+        values = np.frombuffer(self.values, dtype = np.int64).astype("datetime64[us]")
+        values[np.frombuffer(bytes(self.valid), dtype = np.uint8) == 0] = np.datetime64("NaT")
+        return values
+
+class _CategoryColumn(Column):
+
+    "Coluna dicionarizada (select/status): categorias únicas + códigos `int32` (`-1` = nulo)"
+
+    kind = "category"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.categories : List[Any]      = []
+        self.codes      : array          = array("i")
+        self._index     : Dict[Any, int] = {}
+
+    def append(self, value : Any) -> None:
+        if isinstance(value, dict):
+            value = value.get("name")
+        if value is None:
+            self.codes.append(-1)
+            self.valid.append(0)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+        self.valid.append(1)
+
+    def to_list(self) -> List[Any]:
+        categories = self.categories
+        return [categories[code] if code >= 0 else None for code in self.codes]
+
+    def to_numpy(self, np : Any) -> Any:
+        return np.frombuffer(self.codes, dtype = np.int32).copy()
+
+class _ObjectColumn(Column):
+
+    "Coluna genérica (texto, listas, dicts)"
+
+    kind = "object"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values : List[Any] = []
+
+    def append(self, value : Any) -> None:
+        self.values.append(value)
+        self.valid.append(0 if value is None else 1)
+
+    def to_list(self) -> List[Any]:
+        return list(self.values)
+
+    def to_numpy(self, np : Any) -> Any:
+        values = np.empty(len(self.values), dtype = object)
+        values[:] = self.values
+        return values
+
+def _unwrap(annotation : Any) -> Any:
+    "Remove `Optional[...]` (ou `X | None`) de uma anotação"
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+def _new_column(annotation : Any, property_type : Optional[str]) -> Column:
+
+    "Escolhe o buffer da coluna pela anotação do campo e pelo tipo da propriedade no Notion"
+
+    annotation = _unwrap(annotation)
+
+    if property_type in ("select", "status") and annotation in (str, Any):
+        return _CategoryColumn()
+    if annotation is bool:
+        return _TypedColumn("b", "bool", bool)
+    if annotation is int:
+        return _TypedColumn("q", "int", _to_int)
+    if annotation in (float, Decimal):
+        return _TypedColumn("d", "float", float)
+    if annotation in (datetime, date):
+        return _DatetimeColumn()
+    return _ObjectColumn()
+
+class ColumnarResult:
+
+    """
+    Resultado de uma query em colunas, indexadas pelos nomes Python dos campos do schema.
+
+    Números e checkboxes ficam em `array` tipados, datas em microssegundos desde a epoch
+    e select/status dicionarizados. Cada coluna guarda uma máscara de validade (`valid`).
+
+    Uso:
+    ----
+    result = await repo.SearchPage.columns()
+    result["credit"].to_list()
+    result.to_numpy()  # exige numpy instalado
+    """
+
+    def __init__(self,
+        db_class : Type[_NotionDatabase]
+    ) -> None:
+
+        config = db_class._notion_config
+
+        self.db_class = db_class
+        self.ids      : List[str]         = []
+        self.columns  : Dict[str, Column] = {}
+
+        self._annotations = {
+            field_name : db_class.model_fields[field_name].annotation
+            for field_name in config.field_mappings
+            if field_name in db_class.model_fields
+        }
+        self._fields = tuple(
+            (
+                field_name,
+                config.field_mappings[field_name],
+                config.transformers.get(field_name),
+                config.validators.get(field_name)
+            )
+            for field_name in self._annotations
+        )
+
+    def append(self,
+        page_id    : str,
+        properties : Dict[str, Any],
+        raw        : Dict[str, Any]
+    ) -> None:
+
+        """
+        Adiciona uma linha.
+
+        Args:
+            page_id: ID da página
+            properties: Propriedades parseadas (nome no Notion -> valor extraído)
+            raw: Propriedades cruas da API, usadas para descobrir o tipo de cada coluna
+        """
+
+        columns = self.columns
+
+        for field_name, notion_name, transformer, validator in self._fields:
+
+            value = properties.get(notion_name)
+            if transformer:
+                value = transformer(value)
+            if validator:
+                value = validator(value)
+
+            column = columns.get(field_name)
+            if column is None:
+                prop = raw.get(notion_name)
+                column = columns[field_name] = _new_column(
+                    self._annotations[field_name],
+                    prop.get("type") if isinstance(prop, dict) else None
+                )
+
+            column.append(value)
+
+        self.ids.append(page_id)
+
+    def extend(self,
+        pages  : Iterable[Dict[str, Any]],
+        parser : Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+    ) -> None:
+
+        "Adiciona as páginas cruas de uma resposta, parseando cada uma e descartando o payload"
+
+        for page in pages:
+            self.append(page["id"], parser(page) or {}, page.get("properties") or {})
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, field_name : str) -> Column:
+        return self.columns[field_name]
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        "Colunas como listas Python, com `None` nas posições nulas"
+        result : Dict[str, List[Any]] = {"id": list(self.ids)}
+        for field_name, column in self.columns.items():
+            result[field_name] = column.to_list()
+        return result
+
+    def to_numpy(self) -> Dict[str, Any]:
+
+        """
+        Colunas como arrays NumPy: `float64` (nulos = NaN), `int64`/`bool` (mascarados se houver nulos),
+        `datetime64[us]` (nulos = NaT) e códigos `int32` para categorias (ver `Column.categories`).
+        """
+
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("to_numpy() exige numpy. Instale com: pip install sdk-notion[numpy]") from None
+
+        result : Dict[str, Any] = {"id": np.array(self.ids, dtype = object)}
+        for field_name, column in self.columns.items():
+            result[field_name] = column.to_numpy(np)
+        return result
+
+__all__ = ["ColumnarResult", "Column"]
@@ -0,0 +1,9 @@
+from .Columnar import ColumnarResult as _ColumnarResult
+
+class _Export:
+
+    def __init__(self) -> None:
+        self.ColumnarResult = _ColumnarResult
+
+Export = _Export()
+__all__ = ["Export"]
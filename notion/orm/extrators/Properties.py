@@ -1,9 +1,103 @@
-from typing   import Optional, Any
-from datetime import datetime
+import re
+from functools import lru_cache
+from typing    import Optional, Any, Callable, ClassVar, Dict, Iterable, List, Union
+from datetime  import datetime
+
+_FRACTION = re.compile(r"\.(\d+)")
+
+@lru_cache(maxsize = 4096)
+def _parse_iso(date_str : str) -> Optional[datetime]:
+
+    """
+    Converte datas ISO 8601 do Notion (`2024-01-31`, `2024-01-31T10:00:00.000Z`,
+    `2024-01-31T10:00:00.000-03:00`) em `datetime`. Datas com fuso retornam `datetime` aware.
+
+    Memoizado: muitas linhas compartilham as mesmas datas e `datetime` é imutável.
+    """
+
+    if date_str.endswith("Z"):
+        date_str = date_str[:-1] + "+00:00"
+
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+
+    # Python < 3.11 só aceita frações com 3 ou 6 dígitos
+    normalized = _FRACTION.sub(lambda match: "." + match.group(1)[:6].ljust(6, "0"), date_str, count = 1)
+    try:
+        return datetime.fromisoformat(normalized)
+    except ValueError:
+        return None
+
+def _parse_datetime(date_str : Optional[str]) -> Optional[datetime]:
+    "Converte uma data do Notion em `datetime`, ou `None` se vazia/inválida"
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse_iso(date_str)
 
 class PropertyExtractor:
 
-    "Classe base com métodos de extração de propriedades do Notion"
+    """
+    Classe base com métodos de extração de propriedades do Notion.
+
+    O despacho tipo → extrator é montado uma única vez por classe a partir de `_types`.
+    Subclasses podem declarar tipos extras no próprio `_types` ou usar `register()`.
+    """
+
+    _types : ClassVar[Dict[str, Union[str, Callable]]] = {
+        "title"        : "_title",
+        "rich_text"    : "_rich_text",
+        "number"       : "_number",
+        "checkbox"     : "_checkbox",
+        "url"          : "_url",
+        "select"       : "_select",
+        "status"       : "_status",
+        "multi_select" : "_multi_select",
+        "date"         : "_date",
+        "relation"     : "_relation",
+        "rollup"       : "_rollup",
+        "formula"      : "_formula",
+    }
+
+    _dispatch : ClassVar[Dict[str, Callable]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile()
+
+    @classmethod
+    def _compile(cls) -> None:
+
+        "Monta a tabela de despacho da classe, combinando os `_types` de toda a hierarquia"
+
+        types : Dict[str, Union[str, Callable]] = {}
+        for base in reversed(cls.__mro__):
+            types.update(base.__dict__.get("_types", {}))
+
+        cls._types    = types
+        cls._dispatch = {
+            tipo : getattr(cls, extractor) if isinstance(extractor, str) else extractor
+            for tipo, extractor in types.items()
+        }
+
+    @classmethod
+    def register(cls,
+        tipo      : str,
+        extractor : Callable[[Any, dict], Any]
+    ) -> None:
+
+        """
+        Registra (ou substitui) o extrator de um tipo de propriedade nesta classe.
+        Subclasses definidas depois herdam o registro.
+
+        Args:
+            tipo: Tipo da propriedade no Notion (ex: "email")
+            extractor: Função `(self, prop_data) -> valor`
+        """
+
+        cls._types    = {**cls._types, tipo: extractor}
+        cls._dispatch = {**cls._dispatch, tipo: extractor}
     
     def extract(self, prop_data: dict) -> Any:
         
@@ -17,29 +111,25 @@ class PropertyExtractor:
             Valor extraído da propriedade ou None
         """
 
-        tipo = prop_data.get("type")
-        if not tipo:
-            return None
-        
-        extractors = {
-            "title"        : self._title,
-            "rich_text"    : self._rich_text,
-            "number"       : self._number,
-            "checkbox"     : self._checkbox,
-            "url"          : self._url,
-            "select"       : self._select,
-            "multi_select" : self._multi_select,
-            "date"         : self._date,
-            "relation"     : self._relation,
-            "rollup"       : self._rollup,
-            "formula"      : self._formula,
-        }
-        
-        extractor = extractors.get(tipo)
+        extractor = self._dispatch.get(prop_data.get("type"))
         if extractor:
-            return extractor(prop_data)
+            return extractor(self, prop_data)
         
         return None
+
+    def extract_many(self, props: Iterable[dict]) -> List[Any]:
+
+        "Extrai uma sequência de propriedades de uma vez, na mesma ordem"
+
+        dispatch = self._dispatch
+        results  = []
+        append   = results.append
+
+        for prop_data in props:
+            extractor = dispatch.get(prop_data.get("type"))
+            append(extractor(self, prop_data) if extractor else None)
+
+        return results
     
     def _title(self, prop_data: dict) -> Optional[str]:
         "Extrai conteúdo de propriedade tipo `title`"
@@ -80,6 +170,13 @@ class PropertyExtractor:
             return None
         return {"name": select.get("name"), "color": select.get("color")}
     
+    def _status(self, prop_data: dict) -> Optional[dict]:
+        "Extrai conteúdo de propriedade tipo 'status'"
+        status = prop_data.get("status")
+        if not status:
+            return None
+        return {"name": status.get("name"), "color": status.get("color")}
+
     def _multi_select(self, prop_data: dict) -> Optional[list[dict]]:
         "Extrai conteúdo de propriedade tipo 'multi_select'"
         multi_select = prop_data.get("multi_select")
@@ -98,18 +195,8 @@ class PropertyExtractor:
         if not date:
             return None
         
-        def parse_date(date_str):
-            if not date_str:
-                return None
-            for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except:
-                    continue
-            return None
-        
-        start = parse_date(date.get("start"))
-        end = parse_date(date.get("end"))
+        start = _parse_datetime(date.get("start"))
+        end = _parse_datetime(date.get("end"))
         return {"start": start, "end": end}
     
     def _relation(self, prop_data: dict) -> Optional[list]:
@@ -143,4 +230,6 @@ class PropertyExtractor:
             return formula.get("boolean")
         return None
 
+PropertyExtractor._compile()
+
 __all__ = ["PropertyExtractor"]
\ No newline at end of file
@@ -1,9 +1,58 @@
-from typing   import Dict, Any, Optional, Callable, ClassVar, TypeVar, Type
-from pydantic import field_validator
+import copy
+import types
+import typing
+from datetime import date
+from decimal  import Decimal
+from typing   import Dict, Any, Optional, Callable, ClassVar, TypeVar, Type, FrozenSet, Tuple
+from pydantic import PrivateAttr
 from ...schemas.dto import BaseModelSdk
+from .serializer    import compile_serializer as _compile_serializer, check_untyped as _check_untyped
 
 T = TypeVar('T', bound='NotionDatabase')
 
+# Tipos de propriedade que o SDK sabe escrever
+WRITABLE_TYPES : FrozenSet[str] = frozenset({
+    "title", "rich_text", "number", "checkbox", "select", "status", "multi_select",
+    "date", "relation", "people", "url", "email", "phone_number"
+})
+
+def _infer_property_type(annotation : Any) -> Optional[str]:
+
+    """
+    Tipo de propriedade do Notion deduzido da anotação do campo.
+
+    Só anotações sem ambiguidade são deduzidas (`bool`, números e datas). Um `str` pode ser
+    title, rich_text, select, status, url, email ou phone_number, e listas de `str` podem ser
+    multi_select, relation ou people: esses campos precisam estar em `property_types`.
+    """
+
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+
+    if annotation is bool:
+        return "checkbox"
+    if annotation in (int, float, Decimal):
+        return "number"
+    if isinstance(annotation, type) and issubclass(annotation, date):
+        return "date"
+    return None
+
+def _snapshot(
+    config : 'NotionConfigMeta',
+    values : Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Propriedades serializadas (incluindo as vazias) dos campos graváveis e valores dos campos
+    sem tipo. A cópia profunda isola o estado salvo de alterações in-place nos valores
+    """
+    return copy.deepcopy((
+        config.serializer(values, True),
+        {field_name : values.get(field_name) for field_name in config.untyped}
+    ))
+
 class NotionConfigMeta:
 
     "Metadados de configuração da database do Notion"
@@ -43,6 +92,32 @@ class NotionConfigMeta:
         
         self.transformers.update(transformers_config)
 
+        # Tipo de cada propriedade no Notion, usado na escrita. Os não declarados são
+        # deduzidos das anotações dos campos pela metaclass
+        self.property_types : Dict[str, str] = dict(getattr(config_class, 'property_types', {}))
+
+        for field_name, property_type in self.property_types.items():
+            if property_type not in WRITABLE_TYPES:
+                raise ValueError(
+                    f"Tipo de propriedade inválido para '{field_name}': '{property_type}'. "
+                    f"Use um de: {', '.join(sorted(WRITABLE_TYPES))}"
+                )
+
+        # Funções valor Python -> valor da propriedade, usadas na escrita (inverso dos transformers)
+        self.inverse_transformers : Dict[str, Callable] = getattr(config_class, 'inverse_transformers', {})
+
+        # Campos mapeados sem tipo de propriedade (nem declarado, nem deduzido): não são escritos
+        self.untyped : Tuple[str, ...] = ()
+
+        # Construtor compilado pela metaclass (ver `NotionDatabaseMeta._compile_loader`)
+        self.loader : Optional[Callable[[Dict[str, Any]], Any]] = None
+
+        # Serializador compilado pela metaclass (ver `mapping.serializer.compile_serializer`)
+        self.serializer : Optional[Callable[..., Dict[str, Any]]] = None
+
+        # Nomes no Notion lidos pelo schema; o parser do registry extrai apenas estes
+        self.notion_names : FrozenSet[str] = frozenset(self.field_mappings.values())
+
 class NotionDatabaseMeta(type(BaseModelSdk)):
 
     "Metaclass que processa a classe e injeta funcionalidades do Notion"
@@ -65,23 +140,86 @@ class NotionDatabaseMeta(type(BaseModelSdk)):
             if not config.database_id:
                 raise AttributeError("Database ID is missing")
             
-            # Injeta validators customizados do NotionConfig
-            if config.validators:
-
-                for field_name, validator_func in config.validators.items():
-                    
-                    # Cria um validator Pydantic dinâmico
-                    validator_name = f'validate_{field_name}_notion'
-                    
-                    def make_validator(func):
-                        def validator(cls, v):
-                            return func(v)
-                        return field_validator(field_name)(validator)
-                    
-                    setattr(cls, validator_name, make_validator(validator_func))
+            for field_name in config.field_mappings:
+                if field_name not in config.property_types and field_name in cls.model_fields:
+                    inferred = _infer_property_type(cls.model_fields[field_name].annotation)
+                    if inferred:
+                        config.property_types[field_name] = inferred
+
+            config.untyped = tuple(
+                field_name for field_name in config.field_mappings
+                if field_name in cls.model_fields
+                and field_name not in config.property_types
+                and field_name not in config.computed
+            )
+
+            # Compila o construtor com mappings, transformers, validators e computed fields
+            config.loader = mcs._compile_loader(cls, config)
+
+            # Compila o caminho inverso: campos -> `properties` da API
+            config.serializer = _compile_serializer(cls, config)
         
         return cls
 
+    @staticmethod
+    def _compile_loader(
+        cls    : Type['NotionDatabase'],
+        config : NotionConfigMeta
+    ) -> Callable[[Dict[str, Any]], 'NotionDatabase']:
+
+        """
+        Gera o construtor da classe a partir das propriedades parseadas, resolvido uma única vez.
+
+        Mappings e transformers são aplicados e o modelo é validado uma vez. Os `validators`
+        do `NotionConfig` rodam sobre os valores já validados (como um validator `after`) e os
+        computed fields são calculados sobre a instância validada, validando apenas o próprio campo.
+        """
+
+        mapped = tuple(
+            (field_name, notion_name, config.transformers.get(field_name))
+            for field_name, notion_name in config.field_mappings.items()
+        )
+        validators = tuple(
+            (field_name, validator_func)
+            for field_name, validator_func in config.validators.items()
+            if field_name in cls.model_fields and field_name not in config.computed
+        )
+        computed = tuple(
+            (field_name, compute_func, config.validators.get(field_name))
+            for field_name, compute_func in config.computed.items()
+            if field_name in cls.model_fields
+        )
+
+        validate          = cls.model_validate
+        validate_computed = cls.__pydantic_validator__.validate_assignment
+
+        def loader(page_properties : Dict[str, Any]) -> 'NotionDatabase':
+
+            result = {}
+
+            for field_name, notion_name, transformer in mapped:
+                raw_value = page_properties.get(notion_name)
+                result[field_name] = transformer(raw_value) if transformer else raw_value
+
+            instance = validate(result)
+            values   = instance.__dict__
+
+            for field_name, validator_func in validators:
+                values[field_name] = validator_func(values[field_name])
+
+            for field_name, compute_func, validator_func in computed:
+                # `validate_assignment` substitui o `__dict__` da instância
+                validate_computed(instance, field_name, compute_func(instance))
+                if validator_func:
+                    instance.__dict__[field_name] = validator_func(instance.__dict__[field_name])
+
+            # Estado carregado, base do rastreamento de alterações (ver `changed_properties`)
+            instance.__pydantic_private__["_snapshot"] = _snapshot(config, instance.__dict__)
+
+            return instance
+
+        return loader
+
 class NotionDatabase(BaseModelSdk, metaclass = NotionDatabaseMeta):
 
     """
@@ -100,9 +238,21 @@ class NotionDatabase(BaseModelSdk, metaclass = NotionDatabaseMeta):
                 "credit": "Credit",
                 "type": ("Type", lambda x: [s["name"] for s in x] if x else [])
             }
+            # Opcional, para escrita: tipos não deduzíveis da anotação (campos `str` e listas)
+            property_types = {
+                "name": "title",
+                "type": "multi_select"
+            }
+            # Opcional, para escrita: inverso dos transformers das mappings
+            inverse_transformers = {
+                "type": lambda names: [{"name": name} for name in names]
+            }
     """
 
     _notion_config: ClassVar[NotionConfigMeta]
+
+    # Propriedades serializadas e valores dos campos sem tipo no carregamento da página
+    _snapshot: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = PrivateAttr(default = None)
     
     @classmethod
     def from_notion_page(
@@ -132,38 +282,72 @@ class NotionDatabase(BaseModelSdk, metaclass = NotionDatabaseMeta):
         
         # Se recebeu a página raw, faz o parsing
         if page_parser and 'properties' in page_properties:
+            has_properties  = bool(page_properties.get('properties'))
             page_properties = page_parser(page_properties)
+            # Com `only`, uma página cujas propriedades mapeadas estão vazias parseia para `{}`:
+            # ainda assim a instância é criada, como quando todas as propriedades eram lidas
+            if has_properties and page_properties is not None:
+                return config.loader(page_properties)
         
         if not page_properties:
             return None
         
-        result = {}
-        
-        # Processa campos mapeados
-        for field_name, notion_name in config.field_mappings.items():
+        # Mappings, transformers, validação e computed fields em uma única passada
+        return config.loader(page_properties)
+    
+    def to_notion_properties(self,
+        include_none : bool = False,
+        strict       : bool = True
+    ) -> Dict[str, Any]:
 
-            raw_value = page_properties.get(notion_name)
-            
-            # Aplica transformer se existir
-            if field_name in config.transformers:
-                value = config.transformers[field_name](raw_value)
-            else:
-                value = raw_value
-            
-            result[field_name] = value
-        
-        # Cria instância temporária para computed fields
-        instance = cls(**result)
-        
-        # Processa computed fields
-        for field_name, compute_func in config.computed.items():
+        """
+        Converte a instância no `properties` aceito pela API na criação/atualização de páginas.
+
+        Args:
+            include_none: Inclui campos `None` como propriedades vazias (limpando o valor no Notion)
+            strict: Recusa (`ValueError`) campos mapeados com valor e sem tipo em `property_types`;
+                com `False` eles são omitidos (ex: formulas de uma instância carregada)
+        """
+
+        return type(self)._notion_config.serializer(self.__dict__, include_none, strict)
+
+    def changed_properties(self) -> Dict[str, Any]:
+
+        """
+        Propriedades (no formato da API) alteradas desde que a instância foi carregada do Notion.
+
+        A comparação é feita sobre os valores serializados: atribuir um valor equivalente
+        não conta como alteração, e campos esvaziados viram propriedades vazias. Instâncias
+        criadas diretamente (sem carregamento) retornam todas as propriedades não nulas.
+        Alterar um campo sem tipo de propriedade levanta `ValueError`, em vez de ser ignorado.
+        """
+
+        config   = type(self)._notion_config
+        values   = self.__dict__
+        snapshot = self._snapshot
+
+        if snapshot is None:
+            return config.serializer(values, strict = True)
+
+        properties, untyped = snapshot
+        _check_untyped(type(self), tuple(
+            field_name for field_name in config.untyped
+            if values.get(field_name) != untyped.get(field_name)
+        ), values)
+
+        current = config.serializer(values, True)
+        return {
+            notion_name : prop
+            for notion_name, prop in current.items()
+            if properties.get(notion_name) != prop
+        }
+
+    def mark_clean(self) -> None:
+
+        "Registra os valores atuais como o estado salvo no Notion"
+
+        self._snapshot = _snapshot(type(self)._notion_config, self.__dict__)
 
-            computed_value     = compute_func(instance)
-            result[field_name] = computed_value
-        
-        # Retorna instância final com computed fields
-        return cls(**result)
-    
     @classmethod
     def id(cls) -> str:
 
@@ -1,3 +1,4 @@
+from functools import partial
 from typing    import Dict, Any, Optional, Callable, Type
 from .database import NotionDatabase as _NotionDatabase
 
@@ -38,11 +39,33 @@ class DatabaseRegistry:
         "Retorna a classe de schema de uma database"
 
         return cls._databases.get(database_id)
+
+    @classmethod
+    def resolve(cls,
+        database_id : Optional[str]
+    ) -> Optional[Type[_NotionDatabase]]:
+
+        "Como `get`, mas aceita o id com ou sem hífens (como vem no `parent` das páginas da API)"
+
+        if not database_id:
+            return None
+
+        db_class = cls._databases.get(database_id)
+        if db_class is not None:
+            return db_class
+
+        normalized = database_id.replace("-", "").lower()
+        for registered_id, db_class in cls._databases.items():
+            if registered_id.replace("-", "").lower() == normalized:
+                return db_class
+
+        return None
     
     @classmethod
     def get_parser(cls,
         database_id : str,
-        page_parser : Callable
+        page_parser : Callable,
+        only_mapped : bool = False
     ) -> Callable:
 
         """
@@ -51,6 +74,9 @@ class DatabaseRegistry:
         Args:
             database_id: ID da Database
             page_parser: Função que parseia páginas (ex: PageProperties.parse)
+            only_mapped: Extrai apenas as propriedades referenciadas nas `mappings` do schema.
+                `page_parser` deve aceitar o argumento `only` (como `PageProperties.parse`).
+                Desativado por padrão para não quebrar parsers customizados
         
         Returns:
             Função parser ou None se database não encontrada
@@ -59,6 +85,9 @@ class DatabaseRegistry:
         db_class = cls.get(database_id)
         if not db_class:
             raise ValueError(f"Database de ID '{database_id}' não está registrada")
+
+        if only_mapped:
+            page_parser = partial(page_parser, only = db_class._notion_config.notion_names)
         
         def parser(page : Dict[str, Any]) -> Optional[_NotionDatabase]:
             return db_class.from_notion_page(page, page_parser)
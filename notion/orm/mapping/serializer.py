@@ -0,0 +1,191 @@
+from datetime import datetime, date
+from decimal  import Decimal
+from typing   import Dict, Any, Callable, Mapping, Tuple, TYPE_CHECKING
+from ..config import ORMConfig
+
+if TYPE_CHECKING:
+    from .database import NotionConfigMeta
+
+def _rich_items(items : Any) -> list:
+    return [item.model_dump(exclude_none = True) if hasattr(item, "model_dump") else item for item in items]
+
+def _plain_text(items : list) -> str:
+    "Texto corrido de uma lista de rich text já convertida em dicts"
+    return "".join(
+        item.get("plain_text") if item.get("plain_text") is not None else (item.get("text") or {}).get("content") or ""
+        for item in items
+    )
+
+def _text(value : Any) -> Any:
+
+    """
+    Texto simples vira um rich text; listas de rich text são mantidas. O valor extraído de
+    `rich_text` (`{"text", "detailed"}`, dict ou `RichText`) usa `detailed` (preservando a
+    formatação) apenas se não estiver vazio e ainda corresponder a `text`; senão escreve `text`
+    """
+
+    if hasattr(value, "detailed"):
+        value = {"text": value.text, "detailed": value.detailed}
+    if isinstance(value, dict):
+        if "detailed" in value or isinstance(value.get("text"), str):
+            text     = value.get("text") or ""
+            detailed = _rich_items(value.get("detailed") or [])
+            if detailed and _plain_text(detailed) == text:
+                return detailed
+            return [{"text": {"content": text}}] if text else []
+        # Objeto rich text da API
+        return [value]
+    if isinstance(value, list):
+        return _rich_items(value)
+    return [{"text": {"content": str(value)}}]
+
+def _name(value : Any) -> Dict[str, Any]:
+    return {"name": value["name"] if isinstance(value, dict) else str(value)}
+
+def _id(value : Any) -> str:
+    return str(value["id"] if isinstance(value, dict) else value)
+
+def _date_value(value : Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.isoformat()
+        return value.isoformat(timespec = "seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+def _date(value : Any) -> Dict[str, Any]:
+
+    "Datas sem fuso usam a timezone configurada no ORM, como `SetProperty.start_date`"
+
+    if isinstance(value, dict):
+        payload = {"start": _date_value(value.get("start"))}
+        if value.get("end"):
+            payload["end"] = _date_value(value["end"])
+        if value.get("time_zone"):
+            payload["time_zone"] = value["time_zone"]
+        elif isinstance(value.get("start"), datetime) and value["start"].tzinfo is None:
+            payload["time_zone"] = ORMConfig.get_timezone()
+        return payload
+
+    payload = {"start": _date_value(value)}
+    if isinstance(value, datetime) and value.tzinfo is None:
+        payload["time_zone"] = ORMConfig.get_timezone()
+    return payload
+
+def _number(value : Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+def _many(value : Any) -> list:
+    return [value] if isinstance(value, (str, dict)) else list(value)
+
+# Tipo da propriedade -> (valor Python -> propriedade da API)
+_ENCODERS : Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "title"        : lambda value: {"title": _text(value)},
+    "rich_text"    : lambda value: {"rich_text": _text(value)},
+    "number"       : lambda value: {"number": _number(value)},
+    "checkbox"     : lambda value: {"checkbox": bool(value)},
+    "select"       : lambda value: {"select": _name(value)},
+    "status"       : lambda value: {"status": _name(value)},
+    "multi_select" : lambda value: {"multi_select": [_name(item) for item in _many(value)]},
+    "date"         : lambda value: {"date": _date(value)},
+    "relation"     : lambda value: {"relation": [{"id": _id(item)} for item in _many(value)]},
+    "people"       : lambda value: {"people": [{"object": "user", "id": _id(item)} for item in _many(value)]},
+    "url"          : lambda value: {"url": str(value)},
+    "email"        : lambda value: {"email": str(value)},
+    "phone_number" : lambda value: {"phone_number": str(value)},
+}
+
+# Tipo da propriedade -> propriedade vazia, usada para limpar o valor em atualizações
+_EMPTY : Dict[str, Callable[[], Dict[str, Any]]] = {
+    "title"        : lambda: {"title": []},
+    "rich_text"    : lambda: {"rich_text": []},
+    "number"       : lambda: {"number": None},
+    "checkbox"     : lambda: {"checkbox": False},
+    "select"       : lambda: {"select": None},
+    "status"       : lambda: {"status": None},
+    "multi_select" : lambda: {"multi_select": []},
+    "date"         : lambda: {"date": None},
+    "relation"     : lambda: {"relation": []},
+    "people"       : lambda: {"people": []},
+    "url"          : lambda: {"url": None},
+    "email"        : lambda: {"email": None},
+    "phone_number" : lambda: {"phone_number": None},
+}
+
+def check_untyped(
+    cls     : type,
+    untyped : Tuple[str, ...],
+    values  : Mapping[str, Any]
+) -> None:
+
+    "Recusa valores em campos mapeados sem tipo de propriedade, que seriam omitidos da escrita"
+
+    fields = [field_name for field_name in untyped if values.get(field_name) is not None]
+    if fields:
+        raise ValueError(
+            f"Campos sem tipo de propriedade em '{cls.__name__}': {', '.join(fields)}. "
+            f"Declare-os em NotionConfig.property_types (formula, rollup e demais propriedades "
+            f"somente leitura não podem ser escritas)"
+        )
+
+def compile_serializer(
+    cls    : type,
+    config : 'NotionConfigMeta'
+) -> Callable[..., Dict[str, Any]]:
+
+    """
+    Gera o serializador da classe: campos Python -> `properties` da API, resolvido uma única vez.
+
+    Cada campo mapeado com tipo conhecido (`property_types`) recebe seu encoder; o
+    `inverse_transformers` do campo, se houver, converte o valor de volta para o formato
+    da propriedade antes. Computed fields não são escritos. Campos sem tipo (`config.untyped`)
+    são omitidos, ou recusados com `strict` quando têm valor.
+    """
+
+    untyped = config.untyped
+
+    fields = tuple(
+        (
+            field_name,
+            notion_name,
+            _ENCODERS[config.property_types[field_name]],
+            _EMPTY[config.property_types[field_name]],
+            config.inverse_transformers.get(field_name)
+        )
+        for field_name, notion_name in config.field_mappings.items()
+        if field_name in config.property_types and field_name not in config.computed
+    )
+
+    def serializer(
+        values       : Mapping[str, Any],
+        include_none : bool = False,
+        strict       : bool = False
+    ) -> Dict[str, Any]:
+
+        if strict and untyped:
+            check_untyped(cls, untyped, values)
+
+        result = {}
+
+        for field_name, notion_name, encode, empty, inverse in fields:
+
+            if field_name not in values:
+                continue
+
+            value = values[field_name]
+            if value is not None and inverse is not None:
+                value = inverse(value)
+
+            if value is None:
+                if include_none:
+                    result[notion_name] = empty()
+                continue
+
+            result[notion_name] = encode(value)
+
+        return result
+
+    return serializer
+
+__all__ = ["compile_serializer", "check_untyped"]
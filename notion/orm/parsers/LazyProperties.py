@@ -0,0 +1,159 @@
+from typing   import Optional, Dict, Any, Callable, Type, Tuple, Annotated
+from pydantic import TypeAdapter
+from ..mapping.database import NotionDatabase as _NotionDatabase
+from .PageProperties    import PageProperties as _PageProperties
+
+_MISSING = object()
+
+# TypeAdapter de cada campo, criado no primeiro acesso: (classe, campo) -> adapter
+_adapters : Dict[Tuple[type, str], TypeAdapter] = {}
+
+def _adapter(db_class : Type[_NotionDatabase], field_name : str) -> TypeAdapter:
+    key = (db_class, field_name)
+    adapter = _adapters.get(key)
+    if adapter is None:
+        # O `FieldInfo` inteiro entra na anotação para manter as restrições de `Field(...)`
+        field = db_class.model_fields[field_name]
+        adapter = _adapters[key] = TypeAdapter(Annotated[field.annotation, field])
+    return adapter
+
+# Campos que só podem ser validados pelo modelo inteiro: (classe, campo) -> bool
+_model_bound : Dict[Tuple[type, str], bool] = {}
+
+def _needs_model(db_class : Type[_NotionDatabase], field_name : str) -> bool:
+
+    "Campos com `@field_validator` (ou schemas com `@model_validator`) não podem ser validados isoladamente"
+
+    key = (db_class, field_name)
+    needs = _model_bound.get(key)
+    if needs is None:
+        decorators = db_class.__pydantic_decorators__
+        needs = _model_bound[key] = bool(decorators.model_validators) or any(
+            field_name in validator.info.fields or "*" in validator.info.fields
+            for validator in decorators.field_validators.values()
+        )
+    return needs
+
+class LazyProperties:
+
+    """
+    Propriedades de uma página parseadas sob demanda.
+
+    Mantém o payload cru da API e só extrai, transforma e valida um campo no primeiro
+    acesso, guardando o resultado. Com schema registrado, os atributos são os campos do
+    `NotionDatabase`; sem schema, as propriedades são acessadas pelo nome no Notion.
+
+    Uso:
+    ----
+    page.properties.name          # campo do schema
+    page.properties["Name"]       # propriedade pelo nome no Notion
+    page.properties.materialize() # instância completa do schema (ou dict parseado)
+    """
+
+    __slots__ = ("_raw", "_db_class", "_values", "_instance")
+
+    def __init__(self,
+        raw      : Dict[str, Any],
+        db_class : Optional[Type[_NotionDatabase]] = None
+    ) -> None:
+        self._raw      = raw or {}
+        self._db_class = db_class
+        self._values   : Dict[str, Any] = {}
+        self._instance : Optional[_NotionDatabase] = None
+
+    @classmethod
+    def parser(cls,
+        db_class : Optional[Type[_NotionDatabase]] = None
+    ) -> Callable[[Dict[str, Any]], 'LazyProperties']:
+
+        "Parser de página que apenas embrulha as propriedades cruas"
+
+        def parser(page : Dict[str, Any]) -> 'LazyProperties':
+            return cls(page.get("properties") or {}, db_class)
+
+        return parser
+
+    def __getitem__(self, notion_name : str) -> Any:
+
+        "Propriedade parseada pelo nome no Notion"
+
+        key = "\0" + notion_name
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            prop_data = self._raw.get(notion_name)
+            if prop_data is None:
+                raise KeyError(notion_name)
+            value = self._values[key] = _PageProperties.extract(prop_data)
+        return value
+
+    def __getattr__(self, name : str) -> Any:
+
+        # Atributos internos (e campos não inicializados durante cópia/pickle)
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        value = self._values.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        db_class = self._db_class
+        if db_class is None:
+            try:
+                return self[name]
+            except KeyError:
+                raise AttributeError(f"Propriedade '{name}' não encontrada na página") from None
+
+        config = db_class._notion_config
+
+        if name in config.computed or (name in db_class.model_fields and _needs_model(db_class, name)):
+            # Computed fields e campos com validators do Pydantic dependem da instância inteira
+            value = getattr(self.materialize(), name, None)
+
+        elif name in config.field_mappings:
+            prop_data = self._raw.get(config.field_mappings[name])
+            value = _PageProperties.extract(prop_data) if prop_data is not None else None
+
+            transformer = config.transformers.get(name)
+            if transformer:
+                value = transformer(value)
+
+            value = _adapter(db_class, name).validate_python(value)
+
+            validator = config.validators.get(name)
+            if validator:
+                value = validator(value)
+
+        elif name in db_class.model_fields:
+            field = db_class.model_fields[name]
+            value = field.get_default(call_default_factory = True)
+
+        else:
+            raise AttributeError(f"'{db_class.__name__}' não possui o campo '{name}'")
+
+        self._values[name] = value
+        return value
+
+    def materialize(self) -> Any:
+
+        """
+        Parseia todas as propriedades de uma vez.
+
+        Returns:
+            Instância do schema registrado, ou dict `nome no Notion -> valor` sem schema
+        """
+
+        db_class = self._db_class
+        if db_class is None:
+            return _PageProperties.parse({"properties": self._raw})
+
+        if self._instance is None:
+            self._instance = db_class.from_notion_page(
+                _PageProperties.parse({"properties": self._raw}, db_class._notion_config.notion_names) or {}
+            )
+        return self._instance
+
+    def __repr__(self) -> str:
+        name = self._db_class.__name__ if self._db_class else "dict"
+        return f"LazyProperties[{name}]({len(self._raw)} propriedades, {len(self._values)} lidas)"
+
+__all__ = ["LazyProperties"]
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AbstractSet, Iterable, List
 from urllib.parse import unquote
 from ..extrators.Properties import PropertyExtractor as _PropertyExtractor
 
@@ -6,7 +6,18 @@ class _PageProperties(_PropertyExtractor):
 
     "Parser completo de página do Notion. Retorna todas as propriedades parseadas de uma vez."
     
-    def parse(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def parse(self,
+        page : Dict[str, Any],
+        only : Optional[AbstractSet[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+
+        """
+        Parseia as propriedades da página.
+
+        Args:
+            page: Página (ou property item) crua da API
+            only: Nomes das propriedades a extrair. As demais são ignoradas sem serem percorridas
+        """
      
         result = {}
         
@@ -24,13 +35,41 @@ class _PageProperties(_PropertyExtractor):
         if not properties:
             return None
 
+        dispatch = self._dispatch
+
+        if only is not None:
+            # Percorre apenas as propriedades pedidas, sem tocar no payload das demais
+            for prop_name in only:
+                prop_data = properties.get(prop_name)
+                if prop_data is None:
+                    continue
+
+                extractor = dispatch.get(prop_data.get("type"))
+                value     = extractor(self, prop_data) if extractor else None
+
+                if value is not None:
+                    result[prop_name] = value
+
+            return result
+
         for prop_name, prop_data in properties.items():
-            value = self.extract(prop_data)
+            extractor = dispatch.get(prop_data.get("type"))
+            value     = extractor(self, prop_data) if extractor else None
             
             if value is not None:
                 result[prop_name] = value
         
         return result
 
+    def parse_many(self,
+        pages : Iterable[Dict[str, Any]],
+        only  : Optional[AbstractSet[str]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+
+        "Parseia uma sequência de páginas de uma vez, na mesma ordem"
+
+        parse = self.parse
+        return [parse(page, only) for page in pages]
+
 PageProperties = _PageProperties()
 __all__ = ["PageProperties"]
\ No newline at end of file
@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing    import Optional, Dict, Any, List, Type
+from pydantic  import TypeAdapter
+from ..mapping.database import NotionDatabase as _NotionDatabase
+from ...schemas.responses.pages.Page import Page  as _Page
+from ...schemas.responses.databases  import Query as _query
+
+class _ResponseModels:
+
+    """
+    Schemas de resposta especializados por database (`Page[TDB]`, `Query[TDB]`), resolvidos
+    uma única vez por classe. As páginas de uma resposta são validadas em lote por um
+    `TypeAdapter` em cache; as propriedades já mapeadas são repassadas sem revalidação.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize = None)
+    def page(db_class : Optional[Type[_NotionDatabase]] = None) -> Type[_Page]:
+        "`Page` especializado para a database (ou genérico, sem schema)"
+        return _Page[db_class] if db_class is not None else _Page
+
+    @staticmethod
+    @lru_cache(maxsize = None)
+    def query(db_class : Optional[Type[_NotionDatabase]] = None) -> Type['_query.Query']:
+        "`Query` especializado para a database (ou genérico, sem schema)"
+        return _query.Query[db_class] if db_class is not None else _query.Query
+
+    @staticmethod
+    @lru_cache(maxsize = None)
+    def _results(db_class : Optional[Type[_NotionDatabase]] = None) -> TypeAdapter:
+        return TypeAdapter(List[_ResponseModels.page(db_class)])
+
+    def validate_pages(self,
+        pages    : List[Dict[str, Any]],
+        db_class : Optional[Type[_NotionDatabase]] = None
+    ) -> List[_Page]:
+
+        "Valida uma lista de páginas de uma vez"
+
+        return self._results(db_class).validate_python(pages)
+
+    def validate_query(self,
+        query    : Dict[str, Any],
+        db_class : Optional[Type[_NotionDatabase]] = None
+    ) -> '_query.Query':
+
+        "Valida as páginas da resposta em lote e monta o `Query` sem revalidá-las"
+
+        return self.query(db_class).model_construct(
+            results          = self.validate_pages(query.get("results", []), db_class),
+            next_cursor      = query.get("next_cursor"),
+            has_more         = query.get("has_more", False),
+            type             = query.get("type", "page_or_database"),
+            page_or_database = query.get("page_or_database", {})
+        )
+
+ResponseModels = _ResponseModels()
+__all__ = ["ResponseModels"]
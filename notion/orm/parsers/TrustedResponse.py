@@ -0,0 +1,129 @@
+from typing import Optional, Dict, Any, Callable, Tuple, Type, TypeVar
+from pydantic import BaseModel
+from ...schemas.responses.pages.Page   import Page   as _Page
+from ...schemas.responses.pages.Parent import Parent as _Parent
+from ...schemas.responses.users.User   import User   as _User
+from ...schemas.responses.databases    import Query  as _query
+from ..extrators.Properties import _parse_datetime
+
+M = TypeVar('M', bound = BaseModel)
+
+_new     = object.__new__
+_setattr = object.__setattr__
+
+def _construct(cls : Type[M], values : Dict[str, Any]) -> M:
+
+    "Instancia o modelo atribuindo os valores diretamente, sem validação (equivalente enxuto de `model_construct`)"
+
+    instance = _new(cls)
+    _setattr(instance, "__dict__", values)
+    _setattr(instance, "__pydantic_fields_set__", set(values))
+    _setattr(instance, "__pydantic_extra__", None)
+    _setattr(instance, "__pydantic_private__", None)
+    return instance
+
+class _TrustedResponse:
+
+    """
+    Constrói os schemas de resposta a partir de dados vindos direto da API, sem revalidá-los.
+
+    `Page`, `Query`, `User` e `Parent` são instanciados sem passar pelo Pydantic, convertendo
+    apenas os timestamps. As propriedades são repassadas como estão: instâncias de
+    `NotionDatabase` já passaram pelo construtor do schema (validators e computed fields inclusos).
+
+    Dentro de uma mesma resposta, `User` e `Parent` iguais são instanciados uma única vez
+    e compartilhados entre as páginas.
+    """
+
+    def user(self,
+        data  : Optional[Dict[str, Any]],
+        users : Optional[Dict[str, _User]] = None
+    ) -> Optional[_User]:
+
+        if data is None:
+            return None
+
+        user_id = data.get("id")
+        if users is None:
+            return _construct(_User, {"id": user_id})
+
+        user = users.get(user_id)
+        if user is None:
+            user = users[user_id] = _construct(_User, {"id": user_id})
+        return user
+
+    def parent(self,
+        data    : Optional[Dict[str, Any]],
+        parents : Optional[Dict[Tuple[Any, ...], _Parent]] = None
+    ) -> Optional[_Parent]:
+
+        if data is None:
+            return None
+
+        key = (data.get("type"), data.get("data_source_id"), data.get("database_id"))
+        parent = parents.get(key) if parents is not None else None
+        if parent is None:
+            parent = _construct(_Parent, {
+                "type"           : key[0],
+                "data_source_id" : key[1],
+                "database_id"    : key[2]
+            })
+            if parents is not None:
+                parents[key] = parent
+        return parent
+
+    def page(self,
+        data    : Dict[str, Any],
+        users   : Optional[Dict[str, _User]] = None,
+        parents : Optional[Dict[Tuple[Any, ...], _Parent]] = None
+    ) -> _Page:
+
+        "Constrói um `Page` a partir de uma página da API (com propriedades já mapeadas ou cruas)"
+
+        return _construct(_Page, {
+            "id"               : data["id"],
+            "created_time"     : _parse_datetime(data.get("created_time")),
+            "last_edited_time" : _parse_datetime(data.get("last_edited_time")),
+            "created_by"       : self.user(data.get("created_by"), users),
+            "last_edited_by"   : self.user(data.get("last_edited_by"), users),
+            "cover"            : data.get("cover"),
+            "icon"             : data.get("icon"),
+            "parent"           : self.parent(data.get("parent"), parents),
+            "archived"         : data.get("archived", False),
+            "properties"       : data.get("properties"),
+            "url"              : data.get("url"),
+            "public_url"       : data.get("public_url"),
+            "related"          : data.get("related") or {}
+        })
+
+    def builder(self) -> Callable[[Dict[str, Any]], _Page]:
+
+        "Retorna um construtor de páginas que compartilha `User`/`Parent` entre as chamadas (ex: ao iterar uma query)"
+
+        users   : Dict[str, _User] = {}
+        parents : Dict[Tuple[Any, ...], _Parent] = {}
+
+        def build(data : Dict[str, Any]) -> _Page:
+            return self.page(data, users, parents)
+
+        return build
+
+    def query(self, data : Dict[str, Any]) -> '_query.Query':
+
+        "Constrói um `Query` a partir de uma resposta de query da API"
+
+        users   : Dict[str, _User] = {}
+        parents : Dict[Tuple[Any, ...], _Parent] = {}
+        page = self.page
+
+        # `Query` é acessado via módulo: este arquivo é carregado durante a importação dele
+        return _construct(_query.Query, {
+            "results"          : [page(result, users, parents) for result in data.get("results", [])],
+            "next_cursor"      : data.get("next_cursor"),
+            "has_more"         : data.get("has_more", False),
+            "type"             : data.get("type", "page_or_database"),
+            "page_or_database" : data.get("page_or_database", {})
+        })
+
+TrustedResponse = _TrustedResponse()
+__all__ = ["TrustedResponse"]
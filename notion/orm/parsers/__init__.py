@@ -1,9 +1,11 @@
 from .PageProperties import PageProperties as _PageProperties
+from .LazyProperties import LazyProperties as _LazyProperties
 
 class _Parser:
 
     def __init__(self) -> None:
         self.page_props = _PageProperties.parse
+        self.lazy_props = _LazyProperties.parser
 
 Parser = _Parser()
 __all__ = ["Parser"]
@@ -0,0 +1,244 @@
+import asyncio
+import json
+import os
+from typing   import Optional, Generic, TypeVar, Dict, Any, List, Union, Iterable, AsyncIterable, AsyncIterator, Type
+from ....schemas.orm.database import Schemas as _schm
+from ...mapping.database   import NotionDatabase as _NotionDatabase
+from ...mapping            import Mapping        as _map
+from .CreateDatabasePage   import CreateDatabasePage as _CreateDatabasePage
+
+TDB = TypeVar('TDB', bound = _NotionDatabase)
+
+Row = Union[_NotionDatabase, Dict[str, Any]]
+
+async def _aiter(rows : Union[Iterable[Row], AsyncIterable[Row]]) -> AsyncIterator[Row]:
+    "Percorre iteráveis síncronos e assíncronos da mesma forma"
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+class _Checkpoint:
+
+    """
+    Linhas já criadas (índice -> page_id), persistidas em JSON com escrita atômica.
+
+    Numa nova execução com o mesmo arquivo, as linhas registradas não são recriadas.
+    """
+
+    def __init__(self,
+        path        : str,
+        database_id : str
+    ) -> None:
+
+        self._path        = path
+        self._database_id = database_id
+        self.done : Dict[int, str] = {}
+
+        if os.path.exists(path):
+            with open(path, "r", encoding = "utf-8") as file:
+                state = json.load(file)
+            if state.get("database_id") != database_id:
+                raise ValueError(f"Checkpoint '{path}' pertence a outra database ({state.get('database_id')})")
+            self.done = {int(index): page_id for index, page_id in state.get("done", {}).items()}
+
+    def save(self, done : Optional[Dict[int, str]] = None) -> None:
+        "Grava o estado; `done` permite gravar uma cópia tirada antes de sair do event loop"
+        temp_path = f"{self._path}.tmp"
+        with open(temp_path, "w", encoding = "utf-8") as file:
+            json.dump({"database_id": self._database_id, "done": self.done if done is None else done}, file)
+        os.replace(temp_path, self._path)
+
+class BulkCreate(Generic[TDB]):
+
+    """
+    Cria páginas em lote na database, com concorrência limitada.
+
+    As criações passam pelo rate limit do client; falhas são registradas por linha
+    sem interromper as demais, e o relatório segue a ordem de entrada.
+    """
+
+    def __init__(self,
+        database_id : str,
+        generic_response : bool = False
+    ) -> None:
+        self._database_id = database_id
+        self._generic_response = generic_response
+
+    def _schema(self) -> Optional[Type[_NotionDatabase]]:
+        if self._generic_response:
+            return None
+        return _map.registry.get(self._database_id)
+
+    def _build(self,
+        row : Row
+    ) -> _CreateDatabasePage:
+
+        """
+        Monta a criação de uma linha.
+
+        Instâncias de `NotionDatabase` e dicts com os campos Python do schema registrado passam
+        pelo serializador compilado do schema (ver `NotionDatabase.to_notion_properties`); os
+        campos do dict são validados pelo schema antes. Chaves do dict com o nome da propriedade
+        no Notion são enviadas como estão, no formato da API. Sem schema, o dict inteiro é usado
+        como o `properties` da API.
+        """
+
+        create = _CreateDatabasePage(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        )
+        properties = create._instance.data["properties"]
+
+        if isinstance(row, _NotionDatabase):
+            db_class, values = type(row), row.__dict__
+        elif isinstance(row, dict):
+            db_class = self._schema()
+            if db_class is None:
+                properties.update(row)
+                return create
+            values = self._validate(db_class, row, properties)
+        else:
+            raise TypeError(f"Linha do tipo '{type(row).__name__}' não suportada. Use um NotionDatabase ou um dict")
+
+        # Serializador compilado do schema: sem despacho por campo. Campos sem tipo de
+        # propriedade com valor falham a linha em vez de serem omitidos
+        properties.update(db_class._notion_config.serializer(values, strict = True))
+
+        return create
+
+    @staticmethod
+    def _validate(
+        db_class   : Type[_NotionDatabase],
+        row        : Dict[str, Any],
+        properties : Dict[str, Any]
+    ) -> Dict[str, Any]:
+
+        "Valida os campos Python de um dict pelo schema; propriedades no formato da API vão direto para `properties`"
+
+        model_fields = db_class.model_fields
+        notion_names = db_class._notion_config.notion_names
+
+        fields = {}
+        for key, value in row.items():
+            if key in model_fields:
+                fields[key] = value
+            elif key in notion_names:
+                properties[key] = value
+            else:
+                raise ValueError(f"'{key}' não é um campo nem uma propriedade mapeada de '{db_class.__name__}'")
+
+        if not fields:
+            return fields
+
+        instance = db_class.model_validate(fields)
+        return {field_name : instance.__dict__[field_name] for field_name in fields}
+
+    async def _create(self,
+        index : int,
+        row   : Row
+    ) -> _schm.BulkCreateRow:
+
+        try:
+            page = await self._build(row).call(map_properties = False, raw_response = True)
+        except KeyError as error:
+            detail = error.args[0] if error.args and isinstance(error.args[0], dict) else {"message": str(error)}
+            return _schm.BulkCreateRow(index = index, ok = False, error = detail)
+        except Exception as error:
+            return _schm.BulkCreateRow(index = index, ok = False, error = {"type": type(error).__name__, "message": str(error)})
+
+        return _schm.BulkCreateRow(index = index, ok = True, page_id = page.id)
+
+    async def call(self,
+        rows             : Union[Iterable[Row], AsyncIterable[Row]],
+        concurrency      : int = 4,
+        checkpoint       : Optional[str] = None,
+        checkpoint_every : int = 50
+    ) -> _schm.BulkCreateResult:
+
+        """
+        Cria uma página por linha.
+
+        Args:
+            rows: Iterável (ou iterável assíncrono) de instâncias do schema ou dicts
+            concurrency: Máximo de criações em andamento ao mesmo tempo
+            checkpoint: Arquivo JSON com as linhas já criadas. Ao repetir a chamada com as mesmas
+                linhas, as registradas são puladas (`resumed`) e apenas as demais são criadas
+            checkpoint_every: Criações entre cada gravação do checkpoint
+
+        Returns:
+            `BulkCreateResult` com uma entrada por linha, na ordem de entrada
+
+        Uso:
+        ----
+        result = await repo.bulk_create(rows, concurrency = 4, checkpoint = "import.json")
+        failed = [row for row in result.rows if not row.ok]
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser maior ou igual a 1")
+
+        state   = _Checkpoint(checkpoint, self._database_id) if checkpoint else None
+        done    = state.done if state is not None else {}
+        results : Dict[int, _schm.BulkCreateRow] = {}
+        queue   : asyncio.Queue = asyncio.Queue(maxsize = concurrency * 2)
+        pending = 0
+
+        async def producer() -> None:
+            index = 0
+            async for row in _aiter(rows):
+                await queue.put((index, row))
+                index += 1
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def worker() -> None:
+
+            nonlocal pending
+
+            while True:
+
+                item = await queue.get()
+                if item is None:
+                    return
+
+                index, row = item
+                if index in done:
+                    results[index] = _schm.BulkCreateRow(index = index, ok = True, page_id = done[index], resumed = True)
+                    continue
+
+                result = results[index] = await self._create(index, row)
+                if state is not None and result.ok:
+                    done[index] = result.page_id
+                    pending += 1
+                    if pending >= checkpoint_every:
+                        pending = 0
+                        await asyncio.to_thread(state.save, dict(done))
+
+        tasks = [asyncio.create_task(producer())] + [asyncio.create_task(worker()) for _ in range(concurrency)]
+
+        try:
+            # Se uma tarefa falha, as demais são canceladas: sem workers, o produtor ficaria
+            # bloqueado na fila cheia
+            finished, _ = await asyncio.wait(tasks, return_when = asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task in finished and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+            if state is not None:
+                state.save()
+
+        ordered = [results[index] for index in sorted(results)]
+        return _schm.BulkCreateResult(
+            rows    = ordered,
+            created = sum(1 for row in ordered if row.ok and not row.resumed),
+            failed  = sum(1 for row in ordered if not row.ok),
+            resumed = sum(1 for row in ordered if row.resumed)
+        )
+
+__all__ = ["BulkCreate"]
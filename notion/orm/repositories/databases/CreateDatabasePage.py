@@ -75,7 +75,8 @@ class CreateDatabasePage(Generic[TDB]):
                     # Tenta pegar parser do registry
                     parser = _map.registry.get_parser(
                         database_id = self._database_id, 
-                        page_parser = _parser.page_props
+                        page_parser = _parser.page_props,
+                        only_mapped = True
                     )
                 
                 # Fallback: se database não registrada, usa parser genérico
@@ -0,0 +1,222 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import time
+from typing   import Optional, Generic, TypeVar, Dict, Any, List, Union, Callable, Literal, TextIO
+from ....schemas.orm.database import Schemas as _schm
+from ....schemas.responses.errors.Error import Error      as _schmError
+from ....client                         import get_client as _get_client
+from ...mapping.database   import NotionDatabase as _NotionDatabase
+from ...common.QueryFilter import QueryFilter    as _Filter, _NotionFilter
+from ...common.QuerySort   import _NotionSort
+from .SearchPage import SearchPage as _SearchPage
+
+TDB = TypeVar('TDB', bound = _NotionDatabase)
+
+class ExportPages(Generic[TDB]):
+
+    """
+    Exporta a database inteira para NDJSON ou CSV, escrevendo as linhas conforme as respostas chegam.
+
+    Cada resposta é parseada pelo schema registrado, serializada e descartada: no máximo
+    `prefetch` respostas e `buffer_rows` linhas ficam em memória, independente do tamanho
+    da database. A escrita acontece em uma thread, sem bloquear as próximas requisições.
+    """
+
+    def __init__(self,
+        database_id : str,
+        generic_response : bool = False
+    ) -> None:
+        self._database_id = database_id
+        self._generic_response = generic_response
+        self.filter = _Filter
+        self._filter_obj : Optional[_NotionFilter] = None
+        self._sort_obj   : Optional[_NotionSort]   = None
+
+    def set_filter(self,
+        filter_obj : _NotionFilter
+    ):
+        "Exporta apenas as páginas que atendem ao filtro"
+        self._filter_obj = filter_obj
+        return self
+
+    def set_sort(self,
+        sort_obj : _NotionSort
+    ):
+        "Define a ordem das linhas exportadas"
+        self._sort_obj = sort_obj
+        return self
+
+    async def call(self,
+        dest        : Union[str, os.PathLike, TextIO],
+        format      : Literal["ndjson", "csv"] = "ndjson",
+        max_items   : Optional[int] = None,
+        buffer_rows : int = 500,
+        prefetch    : int = 1,
+        progress    : Optional[Callable[[_schm.ExportProgress], Any]] = None
+    ) -> _schm.ExportResult:
+
+        """
+        Executa a exportação.
+
+        Args:
+            dest: Caminho do arquivo (sobrescrito) ou stream de texto aberto
+            format: `ndjson` (um objeto JSON por linha) ou `csv` (cabeçalho com `id` + campos do schema,
+                ou todas as propriedades da database sem schema)
+            max_items: Interrompe após N páginas
+            buffer_rows: Linhas acumuladas antes de cada escrita
+            prefetch: Respostas buscadas à frente da escrita
+            progress: Chamado após cada escrita com o `ExportProgress` acumulado (pode ser async)
+
+        Returns:
+            `ExportResult` com linhas, bytes escritos e vazão
+        """
+
+        if format not in ("ndjson", "csv"):
+            raise ValueError(f"Formato '{format}' não suportado. Use 'ndjson' ou 'csv'")
+        if buffer_rows < 1:
+            raise ValueError("buffer_rows deve ser maior ou igual a 1")
+
+        search : _SearchPage[TDB] = _SearchPage(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        ).set_cache(False)
+        if self._filter_obj:
+            search.set_filter(self._filter_obj)
+        if self._sort_obj:
+            search.set_sort(self._sort_obj)
+
+        db_class = search._schema()
+        fields   = ["id"] + list(db_class.model_fields) if db_class is not None else None
+        if fields is None and format == "csv":
+            # Propriedades vazias não entram nas linhas parseadas: o cabeçalho vem do schema da database
+            fields = ["id"] + await self._property_names()
+
+        owns_stream = not hasattr(dest, "write")
+        stream : TextIO = open(dest, "w", encoding = "utf-8", newline = "") if owns_stream else dest
+
+        state  = _schm.ExportProgress()
+        start  = time.perf_counter()
+        buffer : List[Dict[str, Any]] = []
+        writer : Optional[_RowWriter] = None
+
+        async def flush() -> None:
+
+            nonlocal writer
+
+            if not buffer:
+                return
+
+            if writer is None:
+                writer = _RowWriter(format, fields or list(buffer[0]))
+
+            chunk = writer.render(buffer)
+            await asyncio.to_thread(stream.write, chunk)
+
+            state.rows          += len(buffer)
+            state.bytes_written += len(chunk.encode("utf-8"))
+            state.elapsed        = time.perf_counter() - start
+            state.rows_per_second = state.rows / state.elapsed if state.elapsed > 0 else 0.0
+            buffer.clear()
+
+            if progress is not None:
+                result = progress(state.model_copy())
+                if asyncio.iscoroutine(result):
+                    await result
+
+        try:
+            async for page in search.iter(
+                max_items = max_items,
+                prefetch  = prefetch,
+                trusted   = True
+            ):
+                buffer.append(self._row(page.id, page.properties))
+                if len(buffer) >= buffer_rows:
+                    await flush()
+
+            await flush()
+
+            if owns_stream:
+                await asyncio.to_thread(stream.flush)
+
+        finally:
+            if owns_stream:
+                stream.close()
+
+        state.elapsed = time.perf_counter() - start
+        return _schm.ExportResult(
+            format          = format,
+            rows            = state.rows,
+            bytes_written   = state.bytes_written,
+            elapsed         = state.elapsed,
+            rows_per_second = state.rows / state.elapsed if state.elapsed > 0 else 0.0
+        )
+
+    async def _property_names(self) -> List[str]:
+
+        "Nomes das propriedades da database no Notion"
+
+        client = _get_client()
+        database : Dict[str, Any] = await client.databases.get(database_id = self._database_id)
+
+        if database['object'] == 'error':
+            error = _schmError(**database)
+            raise KeyError(error.__dict__)
+
+        return list(database.get("properties") or {})
+
+    @staticmethod
+    def _row(
+        page_id    : str,
+        properties : Any
+    ) -> Dict[str, Any]:
+
+        "Linha serializável: `id` + campos do schema (ou propriedades pelo nome no Notion, sem schema)"
+
+        if isinstance(properties, _NotionDatabase):
+            return {"id": page_id, **properties.model_dump(mode = "json")}
+        return {"id": page_id, **(properties or {})}
+
+def _json_default(value : Any) -> Any:
+    "Datas em ISO 8601; demais tipos não serializáveis como texto"
+    isoformat = getattr(value, "isoformat", None)
+    return isoformat() if isoformat is not None else str(value)
+
+class _RowWriter:
+
+    "Serializa lotes de linhas em NDJSON ou CSV"
+
+    def __init__(self,
+        format : str,
+        fields : List[str]
+    ) -> None:
+        self._format = format
+        self._fields = fields
+        self._header = format == "csv"
+
+    def render(self, rows : List[Dict[str, Any]]) -> str:
+
+        if self._format == "ndjson":
+            return "".join(json.dumps(row, ensure_ascii = False, default = _json_default) + "\n" for row in rows)
+
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames = self._fields, extrasaction = "ignore")
+        if self._header:
+            writer.writeheader()
+            self._header = False
+        for row in rows:
+            writer.writerow({key: self._cell(value) for key, value in row.items()})
+        return output.getvalue()
+
+    @staticmethod
+    def _cell(value : Any) -> Any:
+        "Listas e dicts viram JSON na célula; `None` vira célula vazia"
+        if value is None:
+            return ""
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii = False, default = _json_default)
+        return value
+
+__all__ = ["ExportPages"]
@@ -1,4 +1,7 @@
-from typing   import Optional, Generic, TypeVar
+import asyncio
+import copy
+import heapq
+from typing   import Optional, Generic, TypeVar, Callable, Dict, Any, AsyncIterator, List, Tuple
 from pydantic import validate_call
 from ....client            import get_client as _get_client
 from ....schemas.responses import Schemas    as _schm
@@ -6,9 +9,144 @@ from ...mapping.database   import NotionDatabase as _NotionDatabase
 from ...mapping            import Mapping        as _map
 from ...common.QueryFilter import QueryFilter    as _Filter, _NotionFilter
 from ...common.QuerySort   import QuerySort      as _Sort, _NotionSort
+from ...common.QueryPartition import QueryPartition as _Partition
 from ...parsers            import Parser         as _parser
+from ...config             import ORMConfig      as _config
+from ...parsers.PageProperties import PageProperties as _PageProperties
+from ...parsers.TrustedResponse import TrustedResponse as _TrustedResponse
+from ...parsers.ResponseModels  import ResponseModels  as _ResponseModels
+from ...export.Columnar         import ColumnarResult  as _ColumnarResult
+from ..pages.RelatedLoader      import RelatedLoader   as _RelatedLoader
 
 TDB = TypeVar('TDB', bound = _NotionDatabase)
+T   = TypeVar('T')
+
+_END = object()
+
+class _Failure:
+
+    "Exceção capturada em uma task produtora, repassada ao consumidor"
+
+    def __init__(self, exc : Exception) -> None:
+        self.exc = exc
+
+async def _read_ahead(
+    sources : List[AsyncIterator[T]],
+    depth   : int
+) -> AsyncIterator[T]:
+
+    """
+    Consome cada fonte em uma task separada, mantendo até `depth` itens por fonte prontos
+    à frente do consumidor. Os itens são entregues na ordem em que ficam prontos.
+
+    Exceções das tasks são repassadas ao consumidor; se o consumidor parar antes do fim,
+    as tasks são canceladas.
+    """
+
+    queue : asyncio.Queue = asyncio.Queue(maxsize = max(1, depth * len(sources)))
+
+    async def producer(source : AsyncIterator[T]):
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as exc:
+            await queue.put(_Failure(exc))
+            return
+        await queue.put(_END)
+
+    tasks = [asyncio.create_task(producer(source)) for source in sources]
+    running = len(tasks)
+
+    try:
+        while running:
+            item = await queue.get()
+            if item is _END:
+                running -= 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions = True)
+
+async def _pages(
+    responses : AsyncIterator[Dict[str, Any]]
+) -> AsyncIterator[Dict[str, Any]]:
+
+    "Achata uma sequência de respostas de query em páginas"
+
+    try:
+        async for query in responses:
+            for page in query["results"]:
+                yield page
+    finally:
+        await responses.aclose()
+
+class _SortKey:
+
+    """
+    Chave de ordenação client-side equivalente a uma lista de `sorts` do Notion.
+    Valores vazios ficam por último em qualquer direção, como na API.
+    """
+
+    __slots__ = ("values", "directions")
+
+    def __init__(self, values : Tuple[Any, ...], directions : Tuple[str, ...]) -> None:
+        self.values     = values
+        self.directions = directions
+
+    def __eq__(self, other : object) -> bool:
+        return isinstance(other, _SortKey) and self.values == other.values
+
+    def __lt__(self, other : '_SortKey') -> bool:
+        for a, b, direction in zip(self.values, other.values, self.directions):
+            if a == b:
+                continue
+            if a is None:
+                return False
+            if b is None:
+                return True
+            try:
+                less = a < b
+            except TypeError:
+                less = str(a) < str(b)
+            return less if direction == "ascending" else not less
+        return False
+
+    @staticmethod
+    def _normalize(value : Any) -> Any:
+        "Reduz o valor extraído de uma propriedade a algo comparável"
+        if isinstance(value, dict):
+            for key in ("start", "name", "text"):
+                if key in value:
+                    return value[key]
+            return None
+        if isinstance(value, list):
+            return ",".join(str(_SortKey._normalize(item)) for item in value) if value else None
+        return value
+
+    @classmethod
+    def factory(cls,
+        sorts : List[Dict[str, Any]]
+    ) -> Callable[[Dict[str, Any]], '_SortKey']:
+
+        "Cria a função que calcula a chave de ordenação de uma página crua"
+
+        directions = tuple(sort.get("direction", "ascending") for sort in sorts)
+
+        def key(page : Dict[str, Any]) -> _SortKey:
+            values = []
+            for sort in sorts:
+                if "timestamp" in sort:
+                    values.append(page.get(sort["timestamp"]))
+                    continue
+                prop = (page.get("properties") or {}).get(sort.get("property"))
+                values.append(cls._normalize(_PageProperties.extract(prop)) if prop else None)
+            return cls(tuple(values), directions)
+
+        return key
 
 class SearchPage(Generic[TDB]):
 
@@ -23,6 +161,13 @@ class SearchPage(Generic[TDB]):
         self._filter_obj : Optional[_NotionFilter] = None
         self.sort = _Sort
         self._sort_obj : Optional[_NotionSort] = None
+        self.partition = _Partition
+        self._start_cursor : Optional[str] = None
+        self._use_cache : bool = True
+        self._properties : Optional[List[str]] = None
+        self._projection : bool = True
+        self._related : Tuple[str, ...] = ()
+        self._related_concurrency : int = 8
     
     def set_limit(self,
         page_limit : int
@@ -45,57 +190,477 @@ class SearchPage(Generic[TDB]):
         self._filter_obj = filter_obj
         return self
 
-    @validate_call
-    async def call(self,
-        map_properties : bool = True,
-        raw_response   : bool = False
-    ) -> _schm.databases.Query[TDB]:
+    def set_cursor(self,
+        start_cursor : Optional[str]
+    ):
+        "Define o cursor (`next_cursor` de uma resposta anterior) a partir do qual a query continua"
+        self._start_cursor = start_cursor
+        return self
+
+    def set_cache(self,
+        enabled : bool
+    ):
+        "Ativa ou ignora o `QueryCache` configurado em `Notion(query_cache = ...)` para esta query"
+        self._use_cache = enabled
+        return self
+
+    def set_properties(self,
+        *property_names : str
+    ):
+        "Define explicitamente as propriedades (ids ou nomes) retornadas em cada página"
+        self._properties = list(property_names)
+        return self
+
+    def set_projection(self,
+        enabled : bool
+    ):
+        "Ativa ou desativa a projeção automática pelas `mappings` do schema registrado. Padrão: ativada"
+        self._projection = enabled
+        return self
+
+    def select_related(self,
+        *fields     : str,
+        concurrency : int = 8
+    ):
+
+        """
+        Carrega junto as páginas referenciadas pelos campos de relação informados.
+
+        Os ids de todas as páginas de cada resposta são deduplicados e buscados uma única vez,
+        em paralelo (até `concurrency` por vez, sob o rate limit do client). O resultado fica em
+        `page.related[campo]`, como `Page` com as propriedades mapeadas pelo schema da database
+        relacionada, quando registrada.
+
+        Args:
+            fields: Campos do schema (ou nomes no Notion, sem schema) do tipo relation
+            concurrency: Máximo de páginas relacionadas buscadas ao mesmo tempo
+        """
+
+        self._related = fields
+        self._related_concurrency = concurrency
+        return self
+
+    def _related_loader(self,
+        trusted : Optional[bool]
+    ) -> Optional[_RelatedLoader]:
+        "Loader de relações da chamada, ou `None` sem `select_related`"
+        if not self._related:
+            return None
+        return _RelatedLoader(
+            fields      = self._related,
+            db_class    = self._schema(),
+            concurrency = self._related_concurrency,
+            trusted     = _config.is_trusted(trusted)
+        )
+
+    def _filter_properties(self,
+        map_properties : bool,
+        raw_response   : bool
+    ) -> Optional[List[str]]:
+
+        """
+        Propriedades a serem pedidas via `filter_properties`.
+
+        Com schema registrado e mapeamento ativo, só as propriedades referenciadas nas
+        `mappings` (e as usadas na ordenação) são baixadas.
+        """
+
+        if self._properties is not None:
+            return self._properties
+
+        if not self._projection or self._generic_response or raw_response or not map_properties:
+            return None
+
+        db_class = _map.registry.get(self._database_id)
+        if db_class is None or not hasattr(db_class, '_notion_config'):
+            return None
+
+        names = list(db_class._notion_config.field_mappings.values())
+        if self._sort_obj:
+            names += [sort["property"] for sort in self._sort_obj.to_dict() if "property" in sort]
+
+        return list(dict.fromkeys(names))
+
+    def _payload(self,
+        start_cursor : Optional[str] = None,
+        page_size    : Optional[int] = None
+    ) -> Dict[str, Any]:
+
+        "Monta o corpo da query"
 
         payload = {}
-        if self.query_limit:
-            payload["page_size"] = self.query_limit
+        page_size = page_size or self.query_limit
+        if page_size:
+            payload["page_size"] = page_size
         if self._sort_obj:
             payload["sorts"] = self._sort_obj.to_dict()
         if self._filter_obj:
-            payload["filter"] = self._filter_obj.to_dict()
+            # Forma canônica: filtros equivalentes geram o mesmo payload (e a mesma chave de cache)
+            payload["filter"] = self._filter_obj.normalize().to_dict()
+        if start_cursor:
+            payload["start_cursor"] = start_cursor
+        return payload
+
+    async def _query(self,
+        payload : Dict[str, Any],
+        filter_properties : Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+
+        "Executa a query (ou reaproveita a resposta do cache) e levanta `KeyError` em respostas de erro"
+
+        cache = _config.get_query_cache() if self._use_cache else None
+        if cache is not None:
+            cache_key = cache.key(self._database_id, payload, filter_properties)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         client = _get_client()
 
         query = await client.databases.query(
-            database_id = self._database_id,
-            json_data   = payload
+            database_id       = self._database_id,
+            json_data         = payload,
+            filter_properties = filter_properties
         )
 
         if query['object'] == 'error':
             error = _schm.errors.Error(**query)
             raise KeyError(error.__dict__)
 
-        pages = []
-        results = query["results"]
-
-        if not raw_response:
-            
-            if map_properties:
-
-                parser = None
-                if not self._generic_response:
-                    # Tenta pegar parser do registry
-                    parser = _map.registry.get_parser(
-                        database_id = self._database_id, 
-                        page_parser = _parser.page_props
-                    )
-                
-                # Fallback: se database não registrada, usa parser genérico
-                if not parser:
-                    parser = _parser.page_props
-                
-                for page in results:
-                    page_properties = parser(page)
-                    page["properties"] = page_properties if page_properties else None
-                    pages.append(page)
-
-        results = pages
-
-        return _schm.databases.Query(**query)
-
-__all__ = ["SearchPage"]
\ No newline at end of file
+        if cache is not None:
+            cache.set(self._database_id, cache_key, query)
+
+        return query
+
+    def _get_parser(self,
+        map_properties : bool,
+        raw_response   : bool,
+        lazy           : bool = False
+    ) -> Optional[Callable]:
+
+        "Retorna o parser das propriedades ou `None` quando a resposta deve ser mantida crua"
+
+        if raw_response or not map_properties:
+            return None
+
+        if lazy:
+            db_class = None if self._generic_response else _map.registry.get(self._database_id)
+            return _parser.lazy_props(db_class)
+
+        parser = None
+        if not self._generic_response:
+            # Tenta pegar parser do registry
+            parser = _map.registry.get_parser(
+                database_id = self._database_id, 
+                page_parser = _parser.page_props,
+                only_mapped = True
+            )
+        
+        # Fallback: se database não registrada, usa parser genérico
+        if not parser:
+            parser = _parser.page_props
+
+        return parser
+
+    def _schema(self) -> Optional[type]:
+        "Schema registrado da database, usado para especializar `Page`/`Query`"
+        if self._generic_response:
+            return None
+        return _map.registry.get(self._database_id)
+
+    @staticmethod
+    def _map_page(
+        page   : Dict[str, Any],
+        parser : Optional[Callable]
+    ) -> Dict[str, Any]:
+        if parser is not None:
+            page_properties = parser(page)
+            page["properties"] = page_properties if page_properties else None
+        return page
+
+    @validate_call
+    async def call(self,
+        map_properties : bool = True,
+        raw_response   : bool = False,
+        lazy           : bool = False,
+        trusted        : Optional[bool] = None
+    ) -> _schm.databases.Query[TDB]:
+
+        """
+        Executa a query e retorna uma página de resultados.
+
+        Args:
+            map_properties: Mapeia as propriedades pelo schema registrado
+            raw_response: Mantém as propriedades no formato original da API
+            lazy: Mantém o payload cru em um `LazyProperties`, parseando cada campo só no primeiro acesso
+            trusted: Constrói a resposta sem revalidar os dados da API. `None` usa o configurado em `Notion(trusted_responses = ...)`
+        """
+
+        query = await self._query(
+            self._payload(start_cursor = self._start_cursor),
+            filter_properties = self._filter_properties(map_properties, raw_response)
+        )
+
+        loader = self._related_loader(trusted)
+        if loader is not None:
+            await loader.load(query["results"])
+
+        parser = self._get_parser(map_properties, raw_response, lazy)
+
+        for page in query["results"]:
+            self._map_page(page, parser)
+
+        if _config.is_trusted(trusted):
+            return _TrustedResponse.query(query)
+
+        return _ResponseModels.validate_query(query, self._schema())
+
+    async def _responses(self,
+        max_items : Optional[int] = None,
+        filter_properties : Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+
+        "Percorre a cadeia de cursores da query, produzindo as respostas cruas em ordem"
+
+        cursor  = self._start_cursor
+        fetched = 0
+
+        while True:
+
+            page_size = self.query_limit or 100
+            if max_items is not None:
+                page_size = min(page_size, max_items - fetched)
+                if page_size <= 0:
+                    return
+
+            query = await self._query(
+                self._payload(start_cursor = cursor, page_size = page_size),
+                filter_properties = filter_properties
+            )
+            fetched += len(query["results"])
+
+            yield query
+
+            cursor = query.get("next_cursor")
+            if not query.get("has_more") or not cursor:
+                return
+
+    async def iter(self,
+        max_items      : Optional[int] = None,
+        map_properties : bool = True,
+        raw_response   : bool = False,
+        prefetch       : int  = 1,
+        lazy           : bool = False,
+        trusted        : Optional[bool] = None
+    ) -> AsyncIterator[_schm.pages.Page[TDB]]:
+
+        """
+        Itera por todas as páginas da query seguindo `next_cursor` automaticamente.
+
+        Cada lote é mapeado pelo parser do registry conforme chega. Com `prefetch`,
+        a requisição do próximo cursor é disparada assim que a resposta atual chega,
+        de modo que o parse de um lote acontece enquanto o próximo está na rede.
+
+        Args:
+            max_items: Interrompe a iteração após N páginas. `None` percorre a database inteira
+            map_properties: Mapeia as propriedades pelo schema registrado
+            raw_response: Mantém as propriedades no formato original da API
+            prefetch: Quantidade máxima de respostas buscadas à frente do consumo. `0` desativa a leitura antecipada
+            lazy: Parseia cada campo só no primeiro acesso (ver `LazyProperties`)
+            trusted: Constrói as páginas sem revalidar os dados da API
+
+        Uso:
+        ----
+        async for page in repo.SearchPage.set_filter(...).iter():
+            print(page.properties)
+        """
+
+        parser    = self._get_parser(map_properties, raw_response, lazy)
+        db_class  = self._schema()
+        build     = _TrustedResponse.builder() if _config.is_trusted(trusted) else None
+        loader    = self._related_loader(trusted)
+        responses = self._responses(
+            max_items = max_items,
+            filter_properties = self._filter_properties(map_properties, raw_response)
+        )
+        if prefetch > 0:
+            responses = _read_ahead([responses], depth = prefetch)
+
+        try:
+            async for query in responses:
+                if loader is not None:
+                    await loader.load(query["results"])
+                pages = [self._map_page(page, parser) for page in query["results"]]
+                if build is not None:
+                    for page in pages:
+                        yield build(page)
+                else:
+                    # Valida o lote inteiro de uma vez
+                    for page in _ResponseModels.validate_pages(pages, db_class):
+                        yield page
+        finally:
+            # Interrompe a leitura antecipada quando o consumidor para antes do fim
+            await responses.aclose()
+
+    async def columns(self,
+        max_items : Optional[int] = None,
+        prefetch  : int = 1
+    ) -> _ColumnarResult:
+
+        """
+        Percorre a query inteira acumulando os resultados em colunas, sem instanciar um modelo por linha.
+
+        As colunas são indexadas pelos nomes Python dos campos mapeados do schema registrado
+        (computed fields não são calculados). O payload de cada resposta é descartado assim
+        que suas linhas são copiadas para os buffers.
+
+        Args:
+            max_items: Interrompe após N páginas
+            prefetch: Respostas buscadas à frente do consumo
+
+        Uso:
+        ----
+        result = await repo.SearchPage.set_filter(...).columns()
+        arrays = result.to_numpy()
+        """
+
+        db_class = self._schema()
+        if db_class is None or not hasattr(db_class, '_notion_config'):
+            raise ValueError("columns() exige uma database registrada no registry")
+
+        result    = _ColumnarResult(db_class)
+        only      = db_class._notion_config.notion_names
+        parser    = lambda page: _PageProperties.parse(page, only)
+        responses = self._responses(
+            max_items = max_items,
+            filter_properties = self._filter_properties(True, False)
+        )
+        if prefetch > 0:
+            responses = _read_ahead([responses], depth = prefetch)
+
+        try:
+            async for query in responses:
+                result.extend(query["results"], parser)
+        finally:
+            await responses.aclose()
+
+        return result
+
+    def _shard(self,
+        partition : _NotionFilter
+    ) -> 'SearchPage[TDB]':
+
+        "Cópia desta query restrita a uma partição"
+
+        shard = copy.copy(self)
+        shard._start_cursor = None
+        shard._filter_obj = _Filter.and_(self._filter_obj, partition) if self._filter_obj else partition
+        return shard
+
+    async def iter_partitioned(self,
+        partitions     : List[_NotionFilter],
+        max_items      : Optional[int] = None,
+        map_properties : bool = True,
+        raw_response   : bool = False,
+        prefetch       : int  = 1,
+        ordered        : bool = False,
+        lazy           : bool = False,
+        trusted        : Optional[bool] = None
+    ) -> AsyncIterator[_schm.pages.Page[TDB]]:
+
+        """
+        Lê a database em paralelo, dividindo a query em partições disjuntas.
+
+        Cada partição (combinada com o filtro atual via AND) percorre sua própria cadeia
+        de cursores concorrentemente, sob o rate limit compartilhado do client. Páginas
+        repetidas entre partições são descartadas pelo id.
+
+        Args:
+            partitions: Filtros das partições, ex: `self.partition.created_time(...)` ou `self.partition.values(...)`
+            max_items: Interrompe a iteração após N páginas
+            map_properties: Mapeia as propriedades pelo schema registrado
+            raw_response: Mantém as propriedades no formato original da API
+            prefetch: Respostas buscadas à frente do consumo, por partição
+            ordered: Intercala as partições (k-way merge) respeitando o `set_sort` da query
+            lazy: Parseia cada campo só no primeiro acesso (ver `LazyProperties`)
+            trusted: Constrói as páginas sem revalidar os dados da API
+
+        Uso:
+        ----
+        con = repo.SearchPage
+        async for page in con.iter_partitioned(
+            con.partition.created_time(date(2023, 1, 1), date(2026, 1, 1), shards = 4)
+        ):
+            ...
+        """
+
+        if not partitions:
+            raise ValueError("Nenhuma partição informada")
+        if ordered and not self._sort_obj:
+            raise ValueError("ordered = True exige uma classificação definida com set_sort")
+
+        parser = self._get_parser(map_properties, raw_response, lazy)
+        build  = _TrustedResponse.builder() if _config.is_trusted(trusted) else _ResponseModels.page(self._schema()).model_validate
+        shards = [self._shard(partition) for partition in partitions]
+        depth  = max(1, prefetch)
+        projection = self._filter_properties(map_properties, raw_response)
+
+        if ordered:
+            pages = self._merge_ordered(
+                sources = [
+                    _pages(_read_ahead([shard._responses(filter_properties = projection)], depth = depth))
+                    for shard in shards
+                ],
+                key     = _SortKey.factory(self._sort_obj.to_dict())
+            )
+        else:
+            pages = _pages(_read_ahead(
+                [shard._responses(filter_properties = projection) for shard in shards],
+                depth = depth
+            ))
+
+        seen : set = set()
+        try:
+            async for page in pages:
+                if page["id"] in seen:
+                    continue
+                seen.add(page["id"])
+                yield build(self._map_page(page, parser))
+                if max_items is not None and len(seen) >= max_items:
+                    return
+        finally:
+            await pages.aclose()
+
+    @staticmethod
+    async def _merge_ordered(
+        sources : List[AsyncIterator[Dict[str, Any]]],
+        key     : Callable[[Dict[str, Any]], _SortKey]
+    ) -> AsyncIterator[Dict[str, Any]]:
+
+        "K-way merge de fontes já ordenadas pela mesma chave"
+
+        async def head(source):
+            try:
+                return await source.__anext__()
+            except StopAsyncIteration:
+                return _END
+
+        heap = []
+        try:
+            firsts = await asyncio.gather(*[head(source) for source in sources])
+            for index, page in enumerate(firsts):
+                if page is not _END:
+                    heap.append((key(page), index, page))
+            heapq.heapify(heap)
+
+            while heap:
+                _, index, page = heapq.heappop(heap)
+                yield page
+                following = await head(sources[index])
+                if following is not _END:
+                    heapq.heappush(heap, (key(following), index, following))
+        finally:
+            for source in sources:
+                await source.aclose()
+
+__all__ = ["SearchPage"]
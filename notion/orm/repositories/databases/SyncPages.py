@@ -0,0 +1,152 @@
+from typing   import Optional, Generic, TypeVar, Dict, AsyncIterator
+from datetime import datetime, timedelta
+from ....schemas.orm.database import Schemas as _schm
+from ...mapping.database   import NotionDatabase as _NotionDatabase
+from ...common.QueryFilter import QueryFilter    as _Filter, _NotionFilter
+from ...sync.WatermarkStore import WatermarkStore as _WatermarkStore, MemoryWatermarkStore as _MemoryWatermarkStore
+from .SearchPage import SearchPage as _SearchPage
+
+TDB = TypeVar('TDB', bound = _NotionDatabase)
+
+_default_store = _MemoryWatermarkStore()
+
+class SyncPages(Generic[TDB]):
+
+    """
+    Sincronização incremental de uma database a partir de watermarks de `last_edited_time`.
+
+    Cada execução busca apenas as páginas editadas desde a anterior (menos uma janela de
+    sobreposição, já que o Notion arredonda `last_edited_time` para o minuto), descarta
+    as páginas já entregues sem alteração e persiste o novo watermark no `WatermarkStore`.
+    """
+
+    def __init__(self,
+        database_id : str,
+        generic_response : bool = False
+    ) -> None:
+        self._database_id = database_id
+        self._generic_response = generic_response
+        self.filter = _Filter
+        self._filter_obj : Optional[_NotionFilter] = None
+        self._store   : _WatermarkStore = _default_store
+        self._overlap : timedelta = timedelta(minutes = 2)
+
+    def set_filter(self,
+        filter_obj : _NotionFilter
+    ):
+        "Restringe a sincronização às páginas que atendem ao filtro"
+        self._filter_obj = filter_obj
+        return self
+
+    def set_store(self,
+        store : _WatermarkStore
+    ):
+        "Define onde os watermarks são persistidos. Padrão: memória do processo"
+        self._store = store
+        return self
+
+    def set_overlap(self,
+        overlap : timedelta
+    ):
+        "Define a janela de sobreposição aplicada ao watermark. Padrão: 2 minutos"
+        self._overlap = overlap
+        return self
+
+    def reset(self):
+        "Descarta o watermark da database; a próxima execução sincroniza tudo"
+        self._store.reset(self._database_id)
+        return self
+
+    async def iter(self,
+        map_properties : bool = True,
+        raw_response   : bool = False,
+        prefetch       : int  = 1
+    ) -> AsyncIterator[_schm.SyncChange[TDB]]:
+
+        """
+        Itera pelas páginas inseridas/atualizadas desde a última sincronização.
+        O watermark só é salvo quando a iteração chega ao fim.
+        """
+
+        state = self._store.load(self._database_id) or {}
+        seen  : Dict[str, str] = dict(state.get("seen", {}))
+        since : Optional[datetime] = None
+        watermark : Optional[datetime] = None
+
+        if state.get("watermark"):
+            watermark = datetime.fromisoformat(state["watermark"])
+            since     = watermark - self._overlap
+
+        search : _SearchPage[TDB] = _SearchPage(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        ).set_cache(False)
+        if since is not None:
+            delta_filter = _Filter.timestamp("last_edited_time", "on_or_after", since)
+            search.set_filter(
+                _Filter.and_(self._filter_obj, delta_filter) if self._filter_obj else delta_filter
+            )
+        elif self._filter_obj:
+            search.set_filter(self._filter_obj)
+
+        latest = watermark
+
+        async for page in search.iter(
+            map_properties = map_properties,
+            raw_response   = raw_response,
+            prefetch       = prefetch
+        ):
+
+            edited = page.last_edited_time.isoformat()
+
+            # Já entregue em uma execução anterior, sem alterações
+            if seen.get(page.id) == edited:
+                continue
+
+            if page.id in seen or (since is not None and page.created_time < since):
+                kind = "updated"
+            else:
+                kind = "inserted"
+
+            seen[page.id] = edited
+            if latest is None or page.last_edited_time > latest:
+                latest = page.last_edited_time
+
+            yield _schm.SyncChange(kind = kind, page = page)
+
+        if latest is not None:
+            window_start = latest - self._overlap
+            seen = {
+                page_id : edited for page_id, edited in seen.items()
+                if datetime.fromisoformat(edited) >= window_start
+            }
+            self._store.save(self._database_id, {
+                "watermark" : latest.isoformat(),
+                "seen"      : seen
+            })
+
+    async def call(self,
+        map_properties : bool = True,
+        raw_response   : bool = False
+    ) -> _schm.SyncResult[TDB]:
+
+        "Executa a sincronização e retorna as páginas inseridas e atualizadas"
+
+        result = _schm.SyncResult()
+
+        async for change in self.iter(
+            map_properties = map_properties,
+            raw_response   = raw_response
+        ):
+            if change.kind == "inserted":
+                result.inserted.append(change.page)
+            else:
+                result.updated.append(change.page)
+
+        state = self._store.load(self._database_id)
+        if state and state.get("watermark"):
+            result.watermark = datetime.fromisoformat(state["watermark"])
+
+        return result
+
+__all__ = ["SyncPages"]
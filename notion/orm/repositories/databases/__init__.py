@@ -1,9 +1,14 @@
-from typing import Generic, TypeVar
+import os
+from typing import Generic, TypeVar, Optional, Union, Callable, Literal, TextIO, Any, Iterable, AsyncIterable, Dict
+from ....schemas.orm.database import Schemas as _schm
 from ...mapping.database import NotionDatabase as _NotionDatabase
 from ..pages import _Pages as _Pages
+from .BulkCreate         import BulkCreate         as _BulkCreate
 from .CreateDatabasePage import CreateDatabasePage as _CreateDatabasePage
+from .ExportPages        import ExportPages        as _ExportPages
 from .SearchPage         import SearchPage         as _SearchPage
 from .SearchPageProperty import SearchPageProperty as _SearchPageProperty
+from .SyncPages          import SyncPages          as _SyncPages
 
 TDB = TypeVar('TDB', bound = _NotionDatabase)
 
@@ -37,6 +42,76 @@ class DatabaseClient(Generic[TDB]):
             database_id = self._database_id
         )
 
+    @property
+    def SyncPages(self) -> _SyncPages[TDB]:
+        return _SyncPages(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        )
+
+    @property
+    def BulkCreate(self) -> _BulkCreate[TDB]:
+        return _BulkCreate(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        )
+
+    async def bulk_create(self,
+        rows        : Union[Iterable[Union[TDB, Dict[str, Any]]], AsyncIterable[Union[TDB, Dict[str, Any]]]],
+        concurrency : int = 4,
+        checkpoint  : Optional[str] = None
+    ) -> _schm.BulkCreateResult:
+
+        """
+        Cria uma página por linha, com concorrência limitada e relatório por linha.
+
+        Atalho para `BulkCreate.call()`.
+
+        Uso:
+        ----
+        result = await repo.bulk_create([AccountsDB(...), {"name": "..."}], checkpoint = "import.json")
+        """
+
+        return await self.BulkCreate.call(
+            rows        = rows,
+            concurrency = concurrency,
+            checkpoint  = checkpoint
+        )
+
+    @property
+    def ExportPages(self) -> _ExportPages[TDB]:
+        return _ExportPages(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        )
+
+    async def export(self,
+        dest        : Union[str, os.PathLike, TextIO],
+        format      : Literal["ndjson", "csv"] = "ndjson",
+        max_items   : Optional[int] = None,
+        buffer_rows : int = 500,
+        progress    : Optional[Callable[[_schm.ExportProgress], Any]] = None
+    ) -> _schm.ExportResult:
+
+        """
+        Exporta a database inteira em streaming para NDJSON ou CSV.
+
+        Atalho para `ExportPages.call()`; use `ExportPages` para filtrar ou ordenar.
+
+        Uso:
+        ----
+        result = await repo.export("tasks.ndjson")
+        result = await repo.export("tasks.csv", format = "csv", progress = print)
+        """
+
+        return await self.ExportPages.call(
+            dest        = dest,
+            format      = format,
+            max_items   = max_items,
+            buffer_rows = buffer_rows,
+            progress    = progress
+        )
+
     @property
     def page(self) -> _Pages[TDB]:
         return _Pages(
@@ -5,6 +5,7 @@ from ....schemas.responses.errors.Error import Error       as _schmError
 from ....client                         import get_client  as _get_client
 from ...common.SetProperty import SetProperty as _setProperty
 from ...parsers            import Parser      as _parser
+from ...config             import ORMConfig   as _config
 
 class CreatePage:
 
@@ -165,6 +166,12 @@ class CreatePage:
             error = _schmError(**create)
             raise KeyError(error.__dict__)
 
+        # Respostas de queries em cache da database deixam de ser válidas
+        cache = _config.get_query_cache()
+        database_id = self.data.get("parent", {}).get("database_id")
+        if cache is not None and database_id:
+            cache.invalidate(database_id)
+
         if parse_properties:
 
             properties = _parser.page_props(page = create)
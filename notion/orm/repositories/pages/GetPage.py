@@ -1,10 +1,14 @@
-from typing import Dict, Any, Optional, TypeVar, Generic
+from typing import Dict, Any, Optional, TypeVar, Generic, List, Tuple
 from ....schemas.responses.pages.Page   import Page        as _schmPage
 from ....schemas.responses.errors.Error import Error       as _schmError
 from ....client                         import get_client  as _get_client
 from ...mapping.database import NotionDatabase as _NotionDatabase
 from ...mapping          import Mapping        as _map
 from ...parsers          import Parser         as _parser
+from ...parsers.TrustedResponse import TrustedResponse as _TrustedResponse
+from ...parsers.ResponseModels  import ResponseModels  as _ResponseModels
+from ...config           import ORMConfig      as _config
+from .RelatedLoader      import RelatedLoader  as _RelatedLoader
 
 TDB = TypeVar('TDB', bound =_NotionDatabase)
 
@@ -17,6 +21,10 @@ class GetPage(Generic[TDB]):
         self._database_id : Optional[str] = database_id
         self._generic_response = generic_response
         self._pageid : str
+        self._properties : Optional[List[str]] = None
+        self._projection : bool = True
+        self._related : Tuple[str, ...] = ()
+        self._related_concurrency : int = 8
 
     def set_pageid(self,
         id : str
@@ -30,6 +38,48 @@ class GetPage(Generic[TDB]):
         self._database_id = id
         return self
 
+    def set_properties(self,
+        *property_names : str
+    ) -> 'GetPage[TDB]':
+        "Define explicitamente as propriedades (ids ou nomes) retornadas pela API"
+        self._properties = list(property_names)
+        return self
+
+    def set_projection(self,
+        enabled : bool
+    ) -> 'GetPage[TDB]':
+        "Ativa ou desativa a projeção automática pelas `mappings` do schema registrado. Padrão: ativada"
+        self._projection = enabled
+        return self
+
+    def select_related(self,
+        *fields     : str,
+        concurrency : int = 8
+    ) -> 'GetPage[TDB]':
+        "Carrega junto as páginas referenciadas pelos campos de relação informados (ver `SearchPage.select_related`)"
+        self._related = fields
+        self._related_concurrency = concurrency
+        return self
+
+    def _filter_properties(self,
+        map_properties : bool,
+        raw_response   : bool
+    ) -> Optional[List[str]]:
+
+        "Propriedades a serem pedidas via `filter_properties`: apenas as referenciadas nas `mappings` do schema registrado"
+
+        if self._properties is not None:
+            return self._properties
+
+        if not self._projection or self._generic_response or raw_response or not map_properties or not self._database_id:
+            return None
+
+        db_class = _map.registry.get(self._database_id)
+        if db_class is None or not hasattr(db_class, '_notion_config'):
+            return None
+
+        return list(dict.fromkeys(db_class._notion_config.field_mappings.values()))
+
     async def select(self,
         property : str
     ) -> Optional[Any]:
@@ -37,7 +87,8 @@ class GetPage(Generic[TDB]):
         client = _get_client()
 
         page : Dict[str, Any] = await client.pages.get(
-            page_id = self._pageid
+            page_id = self._pageid,
+            filter_properties = [property] if self._projection else None
         )
 
         if page['object'] == 'error':
@@ -53,29 +104,59 @@ class GetPage(Generic[TDB]):
 
     async def call(self,
         map_properties : bool = True,
-        raw_response   : bool = False
+        raw_response   : bool = False,
+        lazy           : bool = False,
+        trusted        : Optional[bool] = None
     ) -> _schmPage[TDB]:
 
+        """
+        Busca a página.
+
+        Args:
+            map_properties: Mapeia as propriedades pelo schema registrado
+            raw_response: Mantém as propriedades no formato original da API
+            lazy: Mantém o payload cru em um `LazyProperties`, parseando cada campo só no primeiro acesso
+            trusted: Constrói a resposta sem revalidar os dados da API. `None` usa o configurado em `Notion(trusted_responses = ...)`
+        """
+
         client = _get_client()
 
         page : Dict[str, Any] = await client.pages.get(
-            page_id = self._pageid
+            page_id = self._pageid,
+            filter_properties = self._filter_properties(map_properties, raw_response)
         )
 
         if page['object'] == 'error':
             error = _schmError(**page)
             raise KeyError(error.__dict__)
 
+        if self._related:
+            await _RelatedLoader(
+                fields      = self._related,
+                db_class    = None if self._generic_response or not self._database_id else _map.registry.get(self._database_id),
+                concurrency = self._related_concurrency,
+                trusted     = _config.is_trusted(trusted)
+            ).load([page])
+
         if not raw_response:
 
-            if map_properties and self._database_id:
+            if map_properties and lazy:
+
+                db_class = None
+                if self._database_id and not self._generic_response:
+                    db_class = _map.registry.get(self._database_id)
+
+                page["properties"] = _parser.lazy_props(db_class)(page)
+
+            elif map_properties and self._database_id:
 
                 parser = None
                 if not self._generic_response:
                     # Tenta pegar parser do registry
                     parser = _map.registry.get_parser(
                         database_id = self._database_id, 
-                        page_parser = _parser.page_props
+                        page_parser = _parser.page_props,
+                        only_mapped = True
                     )
                 
                 # Fallback: se database não registrada, usa parser genérico
@@ -89,4 +170,11 @@ class GetPage(Generic[TDB]):
 
                 page["properties"] = _parser.page_props(page = page)
 
-        return _schmPage(**page)
+        if _config.is_trusted(trusted):
+            return _TrustedResponse.page(page)
+
+        db_class = None
+        if self._database_id and not self._generic_response:
+            db_class = _map.registry.get(self._database_id)
+
+        return _ResponseModels.page(db_class).model_validate(page)
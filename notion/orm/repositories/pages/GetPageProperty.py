@@ -1,5 +1,6 @@
+import asyncio
 from pydantic import validate_call
-from typing   import Dict, Any, Optional
+from typing   import Dict, Any, Optional, List, Tuple, Iterable
 from ....schemas.responses.errors.Error import Error       as _schmError
 from ....client                         import get_client  as _get_client
 from ...parsers.PageProperties import PageProperties as _PageProperties
@@ -7,9 +8,11 @@ from ...parsers.PageProperties import PageProperties as _PageProperties
 class GetPageProperty:
 
     """
-    # CUIDADO AO UTILIZAR!!
-    ### [Bug Conhecido](https://community.latenode.com/t/notion-api-relation-property-showing-empty-array-despite-ui-showing-connected-pages/25780) na API do Notion impede retornos confiáveis em propriedades paginadas
-    Ultimo teste : 2026-01-10
+    Busca propriedades de páginas pelo endpoint de property items, percorrendo todas as páginas
+    de resultados: relations, people, title e rich_text com mais de 25 itens voltam completos.
+
+    > A API do Notion já apresentou [inconsistências](https://community.latenode.com/t/notion-api-relation-property-showing-empty-array-despite-ui-showing-connected-pages/25780)
+    > em relations exibidas vazias; o SDK segue todos os cursores, mas não corrige o retorno da API.
     """
 
     def __init__(self) -> None:
@@ -30,36 +33,141 @@ class GetPageProperty:
         self._propname = name
         return self
 
-    async def call(self,
-        raw_response : bool = False
+    @staticmethod
+    async def _fetch(
+        page_id       : str,
+        property_name : str
     ) -> Optional[Dict[str, Any]]:
 
+        """
+        Busca a propriedade seguindo `next_cursor` até o fim.
+
+        Returns:
+            Property item único, com os itens paginados reunidos em ordem no formato
+            da propriedade na página (ex: `{"type": "relation", "relation": [...]}`)
+        """
+
         client = _get_client()
 
-        getprop = await client.pages.get_property(
-            page_id       = self._pageid,
-            property_name = self._propname
-        )
+        cursor  : Optional[str] = None
+        results : List[Dict[str, Any]] = []
+        first   : Optional[Dict[str, Any]] = None
+
+        while True:
+
+            getprop = await client.pages.get_property(
+                page_id       = page_id,
+                property_name = property_name,
+                start_cursor  = cursor,
+                page_size     = 100
+            )
+
+            if getprop['object'] == 'error':
+                error = _schmError(**getprop)
+                raise KeyError(error.__dict__)
 
-        if getprop['object'] == 'error':
-            error = _schmError(**getprop)
-            raise KeyError(error.__dict__)
+            if getprop.get("object") == "property_item":
+                # Propriedade não paginada: o valor vem inteiro
+                return getprop
+
+            first = first or getprop
+            results.extend(getprop.get("results") or [])
+
+            cursor = getprop.get("next_cursor")
+            if not getprop.get("has_more") or not cursor:
+                break
+
+        item = first.get("property_item") or {}
+        tipo = item.get("type") or (results[0].get("type") if results else None)
+        if not tipo:
+            return None
+
+        if tipo == "rollup":
+            # O valor agregado vem em `property_item.rollup`; rollups em array listam os itens em `results`
+            rollup = dict(item.get("rollup") or {})
+            if rollup.get("type") in ("array", "incomplete", None):
+                rollup["type"]  = "array"
+                rollup["array"] = results
+            value = rollup
+        else:
+            value = [result.get(tipo) for result in results]
+
+        return {
+            "object" : "property_item",
+            "id"     : item.get("id") or (results[0].get("id") if results else property_name),
+            "type"   : tipo,
+            tipo     : value
+        }
+
+    @staticmethod
+    def _result(
+        prop_data    : Optional[Dict[str, Any]],
+        raw_response : bool
+    ) -> Optional[Dict[str, Any]]:
 
-        prop_data = getprop.get("results")
-        if getprop.get("object") == "property_item":
-            prop_data = [getprop]
         if not prop_data:
             return None
 
-        if not raw_response:
+        if raw_response:
+            return prop_data
 
-            result = _PageProperties.parse(
-                page = prop_data[0]
-            )
-        
-        else:
+        return _PageProperties.parse(
+            page = prop_data
+        )
+
+    async def call(self,
+        raw_response : bool = False
+    ) -> Optional[Dict[str, Any]]:
+
+        """
+        Busca a propriedade configurada em `set_pageid`/`set_propname`.
+
+        Args:
+            raw_response: Retorna o property item reunido, sem parsear
+        """
+
+        prop_data = await self._fetch(self._pageid, self._propname)
+        return self._result(prop_data, raw_response)
+
+    async def call_many(self,
+        items        : Iterable[Tuple[str, str]],
+        concurrency  : int  = 8,
+        raw_response : bool = False
+    ) -> List[Optional[Dict[str, Any]]]:
+
+        """
+        Busca várias propriedades de várias páginas ao mesmo tempo.
+
+        Cada propriedade percorre sua própria cadeia de cursores; até `concurrency`
+        propriedades são buscadas em paralelo, sob o rate limit do client.
+
+        Args:
+            items: Pares `(page_id, propriedade)`
+            concurrency: Máximo de propriedades buscadas ao mesmo tempo
+            raw_response: Retorna os property items reunidos, sem parsear
+
+        Returns:
+            Resultados na mesma ordem de `items`
+
+        Uso:
+        ----
+        results = await Pages.GetPageProperty().call_many([
+            (page_id, "Tasks"),
+            (page_id, "Owners"),
+            (other_page_id, "Tasks")
+        ])
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser maior ou igual a 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
 
-            result = prop_data[0]
+        async def fetch(page_id : str, property_name : str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                prop_data = await self._fetch(page_id, property_name)
+            return self._result(prop_data, raw_response)
 
-        return result
-    
\ No newline at end of file
+        return list(await asyncio.gather(*[
+            fetch(page_id, property_name) for page_id, property_name in items
+        ]))
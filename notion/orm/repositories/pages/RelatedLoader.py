@@ -0,0 +1,187 @@
+import asyncio
+from typing import Optional, Dict, Any, List, Type, Tuple, Callable, Iterable
+from ....schemas.responses.pages.Page   import Page       as _schmPage
+from ....schemas.responses.errors.Error import Error      as _schmError
+from ....client                         import get_client as _get_client
+from ...mapping.database import NotionDatabase as _NotionDatabase
+from ...mapping          import Mapping        as _map
+from ...parsers          import Parser         as _parser
+from ...parsers.TrustedResponse import TrustedResponse as _TrustedResponse
+from ...parsers.ResponseModels  import ResponseModels  as _ResponseModels
+from .GetPageProperty           import GetPageProperty as _GetPageProperty
+
+class RelatedLoader:
+
+    """
+    Carrega as páginas referenciadas por propriedades `relation` em lote.
+
+    Os ids relacionados de todas as páginas de um lote são reunidos e deduplicados antes
+    de qualquer requisição; cada id distinto é buscado uma única vez, concorrentemente
+    (limitado por `concurrency` e pelo rate limit do client). As páginas buscadas ficam
+    num identity map que vive durante a chamada, de modo que a mesma página relacionada
+    é o mesmo objeto em todos os resultados e não é buscada de novo nos lotes seguintes.
+
+    As propriedades das páginas relacionadas são mapeadas pelo schema da database de
+    origem (`parent`) quando ela está registrada no registry.
+    """
+
+    def __init__(self,
+        fields      : Iterable[str],
+        db_class    : Optional[Type[_NotionDatabase]] = None,
+        concurrency : int  = 8,
+        trusted     : bool = False
+    ) -> None:
+
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser maior ou igual a 1")
+
+        self._fields      = self._resolve(tuple(fields), db_class)
+        self._concurrency = concurrency
+        self._build_trusted : Optional[Callable[[Dict[str, Any]], _schmPage]] = _TrustedResponse.builder() if trusted else None
+        self._identity    : Dict[str, Optional[_schmPage]] = {}
+
+    @staticmethod
+    def _resolve(
+        fields   : Tuple[str, ...],
+        db_class : Optional[Type[_NotionDatabase]]
+    ) -> Tuple[Tuple[str, str], ...]:
+
+        "Converte os campos pedidos em pares (chave em `Page.related`, nome da propriedade no Notion)"
+
+        if db_class is None or not hasattr(db_class, '_notion_config'):
+            # Sem schema: os campos já são os nomes no Notion
+            return tuple((field, field) for field in fields)
+
+        field_mappings = db_class._notion_config.field_mappings
+        resolved = []
+        for field in fields:
+            if field in field_mappings:
+                resolved.append((field, field_mappings[field]))
+            elif field in field_mappings.values():
+                resolved.append((field, field))
+            else:
+                raise ValueError(f"'{field}' não é um campo mapeado de '{db_class.__name__}'")
+        return tuple(resolved)
+
+    def _relations(self,
+        page      : Dict[str, Any],
+        truncated : List[Tuple[Dict[str, List[str]], str, str, str]]
+    ) -> Dict[str, List[str]]:
+
+        """
+        Ids relacionados de uma página crua, por campo.
+
+        A página traz no máximo 25 relações por propriedade; as que vêm com `has_more`
+        são registradas em `truncated` para serem completadas pelo endpoint de property items.
+        """
+
+        properties = page.get("properties") or {}
+        relations  = {}
+        for field, notion_name in self._fields:
+            prop = properties.get(notion_name)
+            if isinstance(prop, dict) and prop.get("type") == "relation":
+                relations[field] = [relation["id"] for relation in prop.get("relation") or []]
+                if prop.get("has_more"):
+                    truncated.append((relations, field, page["id"], prop.get("id") or notion_name))
+            else:
+                relations[field] = []
+        return relations
+
+    @staticmethod
+    async def _gather(coros : List[Any]) -> None:
+
+        "Como `asyncio.gather`, mas cancela as demais tarefas quando uma falha"
+
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+            raise
+
+    async def load(self,
+        pages : List[Dict[str, Any]]
+    ) -> None:
+
+        """
+        Busca as páginas relacionadas de um lote e as anexa em `page["related"]`.
+
+        Deve ser chamado com as páginas cruas da API, antes do parse das propriedades.
+        Páginas relacionadas inexistentes ou sem acesso (`object_not_found`) são omitidas.
+        """
+
+        truncated : List[Tuple[Dict[str, List[str]], str, str, str]] = []
+        per_page  = [self._relations(page, truncated) for page in pages]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        if truncated:
+
+            async def complete(
+                relations   : Dict[str, List[str]],
+                field       : str,
+                page_id     : str,
+                property_id : str
+            ) -> None:
+                async with semaphore:
+                    prop = await _GetPageProperty._fetch(page_id, property_id)
+                relations[field] = [relation["id"] for relation in (prop or {}).get("relation") or []]
+
+            await self._gather([complete(*entry) for entry in truncated])
+
+        identity = self._identity
+        missing  = list(dict.fromkeys(
+            page_id
+            for relations in per_page
+            for ids in relations.values()
+            for page_id in ids
+            if page_id not in identity
+        ))
+
+        if missing:
+
+            async def fetch(page_id : str) -> None:
+                async with semaphore:
+                    identity[page_id] = await self._fetch(page_id)
+
+            await self._gather([fetch(page_id) for page_id in missing])
+
+        for page, relations in zip(pages, per_page):
+            page["related"] = {
+                field : [identity[page_id] for page_id in ids if identity[page_id] is not None]
+                for field, ids in relations.items()
+            }
+
+    async def _fetch(self,
+        page_id : str
+    ) -> Optional[_schmPage]:
+
+        client = _get_client()
+        page : Dict[str, Any] = await client.pages.get(page_id = page_id)
+
+        if page['object'] == 'error':
+            error = _schmError(**page)
+            if error.code == "object_not_found":
+                return None
+            raise KeyError(error.__dict__)
+
+        parent   = page.get("parent") or {}
+        db_class = _map.registry.resolve(parent.get("database_id")) or _map.registry.resolve(parent.get("data_source_id"))
+
+        if db_class is not None:
+            parser = _map.registry.get_parser(
+                database_id = db_class.id(),
+                page_parser = _parser.page_props,
+                only_mapped = True
+            )
+            page["properties"] = parser(page)
+        else:
+            page["properties"] = _parser.page_props(page = page)
+
+        if self._build_trusted is not None:
+            return self._build_trusted(page)
+
+        return _ResponseModels.page(db_class).model_validate(page)
+
+__all__ = ["RelatedLoader"]
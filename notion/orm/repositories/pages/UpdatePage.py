@@ -0,0 +1,111 @@
+from typing import Dict, Any, Optional, TypeVar, Generic, Union
+from ....schemas.responses.pages.Page   import Page        as _schmPage
+from ....schemas.responses.errors.Error import Error       as _schmError
+from ....client                         import get_client  as _get_client
+from ...mapping.database import NotionDatabase as _NotionDatabase
+from ...mapping          import Mapping        as _map
+from ...parsers          import Parser         as _parser
+from ...parsers.TrustedResponse import TrustedResponse as _TrustedResponse
+from ...parsers.ResponseModels  import ResponseModels  as _ResponseModels
+from ...config           import ORMConfig      as _config
+
+TDB = TypeVar('TDB', bound = _NotionDatabase)
+
+class UpdatePage(Generic[TDB]):
+
+    """
+    Atualiza uma página a partir de uma instância do schema, enviando apenas o que mudou.
+
+    Instâncias carregadas do Notion guardam os valores do carregamento; o PATCH contém só
+    as propriedades cujo valor serializado difere deles (ver `NotionDatabase.changed_properties`).
+    Sem alterações, nenhuma requisição é feita.
+
+    Uso:
+    ----
+    page = await repo.page.GetPage.set_pageid(page_id).call()
+    page.properties.credit += 10
+    await repo.page.UpdatePage.call(page)
+    """
+
+    def __init__(self,
+        database_id  : Optional[str] = None,
+        generic_response : bool = False
+    ) -> None:
+        self._database_id : Optional[str] = database_id
+        self._generic_response = generic_response
+        self._pageid : Optional[str] = None
+
+    def set_pageid(self,
+        id : str
+    ) -> 'UpdatePage[TDB]':
+        self._pageid = id
+        return self
+
+    async def call(self,
+        page           : Union[_schmPage[TDB], TDB],
+        map_properties : bool = True,
+        trusted        : Optional[bool] = None
+    ) -> Optional[_schmPage[TDB]]:
+
+        """
+        Envia as propriedades alteradas.
+
+        Args:
+            page: `Page` retornado pelo SDK (usa `page.id`) ou a instância do schema (com `set_pageid`)
+            map_properties: Mapeia as propriedades da resposta pelo schema registrado
+            trusted: Constrói a resposta sem revalidar os dados da API
+
+        Returns:
+            Página atualizada, ou `None` quando não havia alterações
+        """
+
+        page_id  = self._pageid
+        instance = page
+        if isinstance(page, _schmPage):
+            page_id  = page_id or page.id
+            instance = page.properties
+
+        if not isinstance(instance, _NotionDatabase):
+            raise TypeError("UpdatePage exige uma instância de NotionDatabase carregada (ou um Page com propriedades mapeadas)")
+        if not page_id:
+            raise ValueError("ID da página não informado. Use set_pageid ou passe o Page")
+
+        properties = instance.changed_properties()
+        if not properties:
+            return None
+
+        client = _get_client()
+
+        update : Dict[str, Any] = await client.pages.update_properties(
+            page_id   = page_id,
+            json_data = {"properties": properties}
+        )
+
+        if update['object'] == 'error':
+            error = _schmError(**update)
+            raise KeyError(error.__dict__)
+
+        instance.mark_clean()
+
+        # Respostas de queries em cache da database deixam de ser válidas
+        cache = _config.get_query_cache()
+        database_id = self._database_id or (update.get("parent") or {}).get("database_id")
+        if cache is not None and database_id:
+            cache.invalidate(database_id)
+
+        db_class = None
+        if not self._generic_response:
+            db_class = _map.registry.get(self._database_id) if self._database_id else type(instance)
+
+        if map_properties:
+            if db_class is not None:
+                update["properties"] = db_class.from_notion_page(update, _parser.page_props)
+            else:
+                update["properties"] = _parser.page_props(page = update)
+
+        if _config.is_trusted(trusted):
+            return _TrustedResponse.page(update)
+
+        return _ResponseModels.page(db_class if map_properties else None).model_validate(update)
+
+__all__ = ["UpdatePage"]
@@ -3,6 +3,7 @@ from ...mapping.database import NotionDatabase as _NotionDatabase
 from .CreatePage      import CreatePage      as _CreatePage
 from .GetPage         import GetPage         as _GetPage
 from .GetPageProperty import GetPageProperty as _GetPageProperty
+from .UpdatePage      import UpdatePage      as _UpdatePage
 
 TDB = TypeVar('TDB', bound = _NotionDatabase)
 
@@ -26,5 +27,12 @@ class _Pages(Generic[TDB]):
             generic_response = self._generic_response
         )
 
+    @property
+    def UpdatePage(self) -> _UpdatePage:
+        return _UpdatePage(
+            database_id = self._database_id,
+            generic_response = self._generic_response
+        )
+
 Pages = _Pages()
 __all__ = ["Pages", "_Pages"]
\ No newline at end of file
@@ -0,0 +1,74 @@
+import json
+import os
+from typing import Dict, Any, Optional
+
+class WatermarkStore:
+
+    """
+    Classe base para persistência dos watermarks de sincronização.
+
+    O estado de cada database é um dict serializável em JSON com o watermark
+    (`last_edited_time` mais recente já sincronizado) e as páginas vistas na janela de sobreposição.
+    """
+
+    def load(self, database_id : str) -> Optional[Dict[str, Any]]:
+        "Retorna o estado salvo da database ou `None` se ela nunca foi sincronizada"
+        raise NotImplementedError
+
+    def save(self, database_id : str, state : Dict[str, Any]) -> None:
+        "Persiste o estado da database"
+        raise NotImplementedError
+
+    def reset(self, database_id : str) -> None:
+        "Descarta o estado da database, forçando uma sincronização completa"
+        raise NotImplementedError
+
+class MemoryWatermarkStore(WatermarkStore):
+
+    "Watermarks mantidos em memória, válidos enquanto o processo estiver ativo"
+
+    def __init__(self) -> None:
+        self._states : Dict[str, Dict[str, Any]] = {}
+
+    def load(self, database_id : str) -> Optional[Dict[str, Any]]:
+        return self._states.get(database_id)
+
+    def save(self, database_id : str, state : Dict[str, Any]) -> None:
+        self._states[database_id] = state
+
+    def reset(self, database_id : str) -> None:
+        self._states.pop(database_id, None)
+
+class FileWatermarkStore(WatermarkStore):
+
+    "Watermarks persistidos em um arquivo JSON, com escrita atômica"
+
+    def __init__(self, path : str) -> None:
+        self._path = path
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self._path):
+            return {}
+        with open(self._path, "r", encoding = "utf-8") as file:
+            return json.load(file)
+
+    def _write(self, states : Dict[str, Dict[str, Any]]) -> None:
+        temp_path = f"{self._path}.tmp"
+        with open(temp_path, "w", encoding = "utf-8") as file:
+            json.dump(states, file)
+        os.replace(temp_path, self._path)
+
+    def load(self, database_id : str) -> Optional[Dict[str, Any]]:
+        return self._read().get(database_id)
+
+    def save(self, database_id : str, state : Dict[str, Any]) -> None:
+        states = self._read()
+        states[database_id] = state
+        self._write(states)
+
+    def reset(self, database_id : str) -> None:
+        states = self._read()
+        if states.pop(database_id, None) is not None:
+            self._write(states)
+
+__all__ = ["WatermarkStore", "MemoryWatermarkStore", "FileWatermarkStore"]
@@ -0,0 +1,13 @@
+from .WatermarkStore import WatermarkStore       as _WatermarkStore
+from .WatermarkStore import MemoryWatermarkStore as _MemoryWatermarkStore
+from .WatermarkStore import FileWatermarkStore   as _FileWatermarkStore
+
+class _Sync:
+
+    def __init__(self) -> None:
+        self.WatermarkStore       = _WatermarkStore
+        self.MemoryWatermarkStore = _MemoryWatermarkStore
+        self.FileWatermarkStore   = _FileWatermarkStore
+
+Sync = _Sync()
+__all__ = ["Sync"]
@@ -0,0 +1,19 @@
+from ....schemas.dto import BaseModelSdk
+from pydantic import ConfigDict
+from typing   import Optional, Dict, Any, List
+
+class BulkCreateRow(BaseModelSdk):
+    model_config = ConfigDict(title="Notion_Orm_Database_BulkCreateRow")
+    index   : int
+    ok      : bool
+    page_id : Optional[str] = None
+    error   : Optional[Dict[str, Any]] = None
+    # Linha já criada numa execução anterior (registrada no checkpoint)
+    resumed : bool = False
+
+class BulkCreateResult(BaseModelSdk):
+    model_config = ConfigDict(title="Notion_Orm_Database_BulkCreateResult")
+    rows    : List[BulkCreateRow]
+    created : int = 0
+    failed  : int = 0
+    resumed : int = 0
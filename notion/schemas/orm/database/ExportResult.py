@@ -0,0 +1,14 @@
+from ....schemas.dto import BaseModelSdk
+from pydantic import ConfigDict
+from typing   import Literal
+
+class ExportProgress(BaseModelSdk):
+    model_config = ConfigDict(title="Notion_Orm_Database_ExportProgress")
+    rows            : int   = 0
+    bytes_written   : int   = 0
+    elapsed         : float = 0.0
+    rows_per_second : float = 0.0
+
+class ExportResult(ExportProgress):
+    model_config = ConfigDict(title="Notion_Orm_Database_ExportResult")
+    format : Literal["ndjson", "csv"]
@@ -0,0 +1,19 @@
+from ....schemas.dto import BaseModelSdk
+from pydantic import ConfigDict
+from typing   import Optional, List, Literal, Generic, TypeVar
+from datetime import datetime
+from ....orm.mapping.database import NotionDatabase as _NotionDatabase
+from ...responses.pages.Page import Page as _Page
+
+TDB = TypeVar('TDB', bound = _NotionDatabase)
+
+class SyncChange(BaseModelSdk, Generic[TDB]):
+    model_config = ConfigDict(title="Notion_Orm_Database_SyncChange")
+    kind : Literal["inserted", "updated"]
+    page : _Page[TDB]
+
+class SyncResult(BaseModelSdk, Generic[TDB]):
+    model_config = ConfigDict(title="Notion_Orm_Database_SyncResult")
+    inserted  : List[_Page[TDB]] = []
+    updated   : List[_Page[TDB]] = []
+    watermark : Optional[datetime] = None
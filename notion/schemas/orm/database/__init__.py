@@ -1,9 +1,21 @@
 from .DatabasesContainer import DatabasesContainer as _DatabasesContainer
 from .SearchPageProperty import SearchPageProperty as _SearchPageProperty
+from .SyncResult         import SyncChange         as _SyncChange
+from .SyncResult         import SyncResult         as _SyncResult
+from .ExportResult       import ExportProgress     as _ExportProgress
+from .ExportResult       import ExportResult       as _ExportResult
+from .BulkCreate         import BulkCreateRow      as _BulkCreateRow
+from .BulkCreate         import BulkCreateResult   as _BulkCreateResult
 
 class Schemas:
 
     DatabasesContainer = _DatabasesContainer
     SearchPageProperty = _SearchPageProperty
+    SyncChange         = _SyncChange
+    SyncResult         = _SyncResult
+    ExportProgress     = _ExportProgress
+    ExportResult       = _ExportResult
+    BulkCreateRow      = _BulkCreateRow
+    BulkCreateResult   = _BulkCreateResult
 
 __all__ = ["Schemas"]
\ No newline at end of file
@@ -1,6 +1,6 @@
 from ....schemas.dto import BaseModelSdk
-from pydantic import ConfigDict
-from typing   import Optional, Any, Dict, Generic, TypeVar, Union
+from pydantic import ConfigDict, SkipValidation
+from typing   import Optional, Any, Dict, List, Generic, TypeVar, Union
 from datetime import datetime
 from ....orm.mapping.database import NotionDatabase as _NotionDatabase
 from ..users.User import User as _User
@@ -19,6 +19,9 @@ class Page(BaseModelSdk, Generic[TDB]):
     icon: Optional[Dict[str, Any]]
     parent: _Parent
     archived: bool
-    properties: Union[Any, TDB]
+    # Propriedades já chegam mapeadas pelo registry (ou cruas da API): não são revalidadas
+    properties: SkipValidation[Union[Any, TDB]]
     url: str
     public_url: Optional[str]
+    # Páginas carregadas por `select_related`, por campo de relação
+    related: SkipValidation[Dict[str, List[Any]]] = {}
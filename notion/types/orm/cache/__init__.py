@@ -0,0 +1 @@
+from ....orm.cache.QueryCache import QueryCache as QueryCache
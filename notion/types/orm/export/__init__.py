@@ -0,0 +1 @@
+from ....orm.export.Columnar import ColumnarResult as ColumnarResult, Column as Column
\ No newline at end of file
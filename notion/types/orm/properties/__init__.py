@@ -1 +1,2 @@
-from ....schemas.orm.properties.RichText import RichText
\ No newline at end of file
+from ....schemas.orm.properties.RichText import RichText
+from ....orm.parsers.LazyProperties    import LazyProperties
\ No newline at end of file
@@ -0,0 +1,3 @@
+from ....orm.sync.WatermarkStore import WatermarkStore       as WatermarkStore
+from ....orm.sync.WatermarkStore import MemoryWatermarkStore as MemoryWatermarkStore
+from ....orm.sync.WatermarkStore import FileWatermarkStore   as FileWatermarkStore